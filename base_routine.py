@@ -1,12 +1,12 @@
 # Charles Doebler at Feral Cat AI
 # Base class for UFO routines
 
-from hardware_manager import HardwareManager
+from hardware_manager import get_hardware_manager
 from color_utils import ColorFunctions
 
 class BaseRoutine:
     def __init__(self):
-        self.hardware = HardwareManager()
+        self.hardware = get_hardware_manager()
         
     def get_color_function(self, mode):
         """Get color function based on mode, with validation."""
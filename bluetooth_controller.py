@@ -290,13 +290,12 @@ class BluefruitController:
     def _simulate_button_b_press(self, target_mode):
         """Simulate a Button B press to change mode and persist to config."""
         try:
-            from config_manager import ConfigManager
-            config_mgr = ConfigManager()
-            config = config_mgr.load_config()
+            from config_manager import load_config, save_config
+            config = load_config()
             
             # Change the mode in config
             config['mode'] = target_mode
-            save_success = config_mgr.save_config(config)
+            save_success = save_config(config)
             
             if save_success:
                 print("[BT] Mode changed to %d and saved to config" % target_mode)
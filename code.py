@@ -18,7 +18,7 @@ Hardware Interface:
 
 Architecture:
     - TaskScheduler: Manages periodic operations (memory, config, status)
-    - ConfigManager: Persistent configuration storage
+    - config_manager: Persistent configuration storage
     - MemoryManager: Tracks and optimizes memory usage
     - InteractionManager: Unified sensor input handling
 
@@ -55,12 +55,30 @@ Note:
 
 from adafruit_circuitplayground import cp
 import time
-from config_manager import ConfigManager
+import gc
+from config_manager import load_config, save_config
 from memory_manager import MemoryManager
 from interaction_manager import InteractionManager
 import microcontroller
 import os
 
+# Optional event-driven button scanning
+try:
+    import board
+    import digitalio
+    import keypad
+
+    _HAS_KEYPAD = True
+except ImportError:
+    _HAS_KEYPAD = False
+
+try:
+    import storage
+
+    _HAS_STORAGE = True
+except ImportError:
+    _HAS_STORAGE = False
+
 # Version tracking
 VERSION = "2.0.3"
 
@@ -70,12 +88,47 @@ debug_audio = False
 debug_memory = False
 debug_interactions = False
 
+# Informational (non-error) output on runtime paths; errors always print
+_VERBOSE = debug_bluetooth or debug_audio or debug_memory or debug_interactions
+
+# Free-heap level (bytes) below which a routine switch forces a collection
+_GC_THRESHOLD = 8000
+
+# Config auto-save pacing (see _config_save_due)
+_CONFIG_SAVE_DELAY_MS = 5000     # Quiet time before a pending change is written
+_CONFIG_MIN_SAVE_GAP_MS = 30000  # Minimum time between two config writes
+
+# All-off frame - slice-assigning it is cheaper than fill((0, 0, 0))
+_ZERO30 = bytes(30)
+
+
+def _ticks_ms():
+    """Return monotonic time in integer milliseconds.
+
+    CircuitPython floats are 30-bit, so time.monotonic() loses millisecond
+    resolution after a few hours of uptime. Integer millisecond compares stay
+    exact and stay within small-int range for days of uptime.
+    """
+    return time.monotonic_ns() // 1000000
+
+
+def _blit(frame):
+    """Write a 30-byte RGB frame to the ring and show it.
+
+    Args:
+        frame (bytes or bytearray): Flat RGB data for pixels 0-9
+    """
+    cp.pixels[0:10] = frame
+    cp.pixels.show()
+
 
 class TaskScheduler:
     """Simple task scheduler for managing periodic operations.
 
     Optimizes performance by controlling when different operations run.
     Tasks execute based on elapsed time intervals without blocking.
+    Intervals are given in seconds and tracked internally as integer
+    milliseconds (see ``_ticks_ms``).
 
     Features:
         - Interval-based execution
@@ -87,13 +140,22 @@ class TaskScheduler:
 
         scheduler = TaskScheduler()
         scheduler.add_task('cleanup', 30.0, gc.collect)
-        scheduler.run_due_tasks(time.monotonic())
+        scheduler.run_due_tasks(_ticks_ms())
     """
 
     def __init__(self):
-        """Initialize the task scheduler."""
-        self.tasks = {}
-        self.last_run = {}
+        """Initialize the task scheduler.
+
+        Tasks are stored as parallel lists (one slot per task) so the
+        per-loop due check is plain list indexing rather than dict lookups.
+        """
+        self._names = []
+        self._intervals = []
+        self._callbacks = []
+        self._enabled = []
+        self._last_run = []
+        self._index = {}
+        self.next_due_ms = None  # Earliest deadline of any enabled task (read-only)
 
     def add_task(self, name, interval, callback, enabled=True):
         """Add a scheduled task.
@@ -103,53 +165,129 @@ class TaskScheduler:
             interval (float): Seconds between executions
             callback (callable): Function to call
             enabled (bool): Whether a task is initially enabled
+
+        Returns:
+            int: Task slot index, usable with set_interval_at()
+
+        Note:
+            The first run is one interval after the task is added.
         """
-        self.tasks[name] = {
-            'interval': interval,
-            'callback': callback,
-            'enabled': enabled
-        }
-        self.last_run[name] = 0
+        now_ms = _ticks_ms()
+        if name in self._index:
+            i = self._index[name]
+            self._intervals[i] = int(interval * 1000)
+            self._callbacks[i] = callback
+            self._enabled[i] = enabled
+            self._last_run[i] = now_ms
+        else:
+            self._index[name] = len(self._names)
+            self._names.append(name)
+            self._intervals.append(int(interval * 1000))
+            self._callbacks.append(callback)
+            self._enabled.append(enabled)
+            self._last_run.append(now_ms)
+
+        self._update_next_due()
+        return self._index[name]
 
     def enable_task(self, name):
         """Enable a scheduled task."""
-        if name in self.tasks:
-            self.tasks[name]['enabled'] = True
+        if name in self._index:
+            self._enabled[self._index[name]] = True
+            self._update_next_due()
 
     def disable_task(self, name):
         """Disable a scheduled task."""
-        if name in self.tasks:
-            self.tasks[name]['enabled'] = False
+        if name in self._index:
+            self._enabled[self._index[name]] = False
+            self._update_next_due()
+
+    def set_interval(self, name, interval):
+        """Change the interval of a scheduled task.
 
-    def run_due_tasks(self, current_time):
+        Args:
+            name (str): Task identifier
+            interval (float): New seconds between executions
+        """
+        if name in self._index:
+            self.set_interval_at(self._index[name], interval)
+
+    def set_interval_at(self, index, interval):
+        """Change the interval of a task by the slot index returned from add_task().
+
+        Args:
+            index (int): Task slot index
+            interval (float): New seconds between executions
+        """
+        self._intervals[index] = int(interval * 1000)
+        self._update_next_due()
+
+    def _update_next_due(self):
+        """Recompute the earliest deadline across enabled tasks (None if none)."""
+        next_due = None
+        for i in range(len(self._intervals)):
+            if self._enabled[i]:
+                due = self._last_run[i] + self._intervals[i]
+                if next_due is None or due < next_due:
+                    next_due = due
+        self.next_due_ms = next_due
+
+    def run_due_tasks(self, current_ms):
         """Run all tasks that are due to execute.
 
         Args:
-            current_time (float): Current monotonic time
+            current_ms (int): Current time from ``_ticks_ms()``
 
-        Returns:
-            list: Task names that were executed
+        Note:
+            Returns after a single compare when no task is due yet, which is
+            the common case for a main loop running many times per second.
+            Hot loops can skip the call entirely by checking ``next_due_ms``.
         """
-        executed_tasks = []
+        next_due = self.next_due_ms
+        if next_due is None or current_ms < next_due:
+            return
+
+        intervals = self._intervals
+        enabled = self._enabled
+        last_run = self._last_run
 
-        for name, task in self.tasks.items():
-            if not task['enabled']:
+        for i in range(len(intervals)):
+            if not enabled[i] or current_ms - last_run[i] < intervals[i]:
                 continue
 
-            if current_time - self.last_run[name] >= task['interval']:
-                try:
-                    task['callback']()
-                    self.last_run[name] = current_time
-                    executed_tasks.append(name)
-                except MemoryError as mem_err:
-                    print("[SCHEDULER] 🚨 Memory error in task %s: %s" % (name,
-                                                                         str(mem_err)))
-                    import gc
-                    gc.collect()
-                except Exception as e:
-                    print("[SCHEDULER] ❌ Task %s failed: %s" % (name, str(e)))
+            try:
+                self._callbacks[i]()
+                last_run[i] = current_ms
+            except MemoryError as mem_err:
+                # Collect before formatting the message, which itself allocates
+                gc.collect()
+                print("[SCHEDULER] 🚨 Memory error in task %s: %s" % (self._names[i],
+                                                                     str(mem_err)))
+            except Exception as e:
+                print("[SCHEDULER] ❌ Task %s failed: %s" % (self._names[i], str(e)))
+
+        self._update_next_due()
+
+
+def _config_save_due(now_ms, dirty_since_ms, last_save_ms):
+    """Check whether a pending config change may be written yet.
+
+    Args:
+        now_ms (int): Current time from ``_ticks_ms()``
+        dirty_since_ms (int): When the pending change was last made
+        last_save_ms (int): When config was last written (None if never)
 
-        return executed_tasks
+    Returns:
+        bool: True once the change has been quiet for ``_CONFIG_SAVE_DELAY_MS``
+        and the last write is at least ``_CONFIG_MIN_SAVE_GAP_MS`` old
+    """
+    if now_ms - dirty_since_ms < _CONFIG_SAVE_DELAY_MS:
+        return False
+    return last_save_ms is None or now_ms - last_save_ms >= _CONFIG_MIN_SAVE_GAP_MS
+
+
+# Cached result of the filesystem write probe (None until first checked)
+_FS_WRITABLE = None
 
 
 def _fs_writable_check():
@@ -160,16 +298,27 @@ def _fs_writable_check():
 
     Note:
         Used to determine if persistent memory features can be enabled.
-        Returns False on OSError (filesystem is read-only).
+        Reads the mount's readonly flag when ``storage`` is available, so
+        no flash write is needed; otherwise falls back to a write probe that
+        returns False on OSError (filesystem is read-only).
+        The result is cached; writability cannot change without a reset.
     """
-    test_path = "._writetest.tmp"
-    try:
-        with open(test_path, "wb") as f:
-            f.write(b"x")
-        os.remove(test_path)
-        return True
-    except OSError:
-        return False
+    global _FS_WRITABLE
+    if _FS_WRITABLE is None and _HAS_STORAGE:
+        try:
+            _FS_WRITABLE = not storage.getmount("/").readonly
+        except (AttributeError, OSError):
+            pass
+    if _FS_WRITABLE is None:
+        test_path = "._writetest.tmp"
+        try:
+            with open(test_path, "wb") as f:
+                f.write(b"x")
+            os.remove(test_path)
+            _FS_WRITABLE = True
+        except OSError:
+            _FS_WRITABLE = False
+    return _FS_WRITABLE
 
 
 def factory_reset():
@@ -178,12 +327,13 @@ def factory_reset():
     Deletes:
         - ufo_memory.json (persistent UFO Intelligence data)
         - config.json (user configuration)
+        - config.json.tmp (left behind if a config save was interrupted)
 
     Then reboots the device to start fresh with factory defaults.
     """
     print("[FACTORY RESET] 🏭 Initiating factory reset...")
 
-    files_to_delete = ['ufo_memory.json', 'config.json']
+    files_to_delete = ['ufo_memory.json', 'config.json', 'config.json.tmp']
     deleted_count = 0
 
     for filename in files_to_delete:
@@ -201,8 +351,7 @@ def factory_reset():
         cp.pixels.fill((0, 255, 0))
         cp.pixels.show()
         time.sleep(0.3)
-        cp.pixels.fill((0, 0, 0))
-        cp.pixels.show()
+        _blit(_ZERO30)
         time.sleep(0.2)
 
     print("[FACTORY RESET] 🚀 Rebooting...")
@@ -235,8 +384,7 @@ def check_factory_reset_combo():
         # Check if buttons are still held
         if not (cp.button_a and cp.button_b):
             print("[FACTORY RESET] ❌ Cancelled - buttons released")
-            cp.pixels.fill((0, 0, 0))
-            cp.pixels.show()
+            _blit(_ZERO30)
             return False
 
         # Pulsing red warning (intensity increases over time)
@@ -260,8 +408,7 @@ def check_factory_reset_combo():
                 cp.pixels.fill((255, 255, 0))
                 cp.pixels.show()
                 time.sleep(0.2)
-                cp.pixels.fill((0, 0, 0))
-                cp.pixels.show()
+                _blit(_ZERO30)
                 time.sleep(0.2)
 
             return False
@@ -272,6 +419,100 @@ def check_factory_reset_combo():
     return False
 
 
+# Feedback tables, indexed by number - 1 (routines, modes and breathing
+# patterns are all numbered 1-4). Module-level tuples so button handlers
+# only index them instead of rebuilding dicts.
+_ROUTINE_COLORS = ((100, 0, 255), (0, 255, 100), (0, 100, 255), (255, 100, 0))
+_ROUTINE_NAMES = ("UFO Intelligence", "Intergalactic Cruising", "Meditate", "Dance Party")
+
+_MODE_COLORS = ((255, 0, 0), (255, 0, 255), (0, 0, 255), (0, 255, 0))
+_MODE_NAMES = ("Rainbow Wheel", "Pink Theme", "Blue Theme", "Green Theme")
+
+_PATTERN_COLORS = ((0, 150, 255), (100, 200, 100), (200, 100, 200), (255, 150, 0))
+
+# Color for an out-of-range routine/mode/pattern (the "Unknown" indicator)
+_UNKNOWN_COLOR = (255, 255, 255)
+_PATTERN_NAMES = ("4-7-8 Breathing", "Box Breathing", "Triangle Breathing", "Deep Relaxation")
+
+
+def _feedback_name(names, number):
+    """Return the display name for a 1-based routine/mode/pattern number."""
+    if 1 <= number <= len(names):
+        return names[number - 1]
+    return "Unknown"
+
+
+# Quadrant positions used by mode feedback
+_MODE_POSITIONS = (0, 3, 6, 9)
+
+# Breathing rings from the center outward: (pixels, brightness scale)
+_PATTERN_RINGS = (
+    ((4, 5), 1.0),
+    ((3, 6), 0.6),
+    ((2, 7), 0.4),
+    ((1, 8, 0, 9), 0.2)
+)
+
+
+def _set_frame_pixel(frame, pos, r, g, b):
+    """Write one RGB triplet into a flat frame at byte offset ``3 * pos``."""
+    offset = pos * 3
+    frame[offset] = r
+    frame[offset + 1] = g
+    frame[offset + 2] = b
+
+
+def _build_frame(positions, color):
+    """Build a flat 30-byte RGB frame with ``color`` at each of ``positions``.
+
+    Args:
+        positions (iterable): Pixel indices to light; all others stay off
+        color (tuple): (r, g, b) color for the lit pixels
+
+    Returns:
+        bytearray: Frame suitable for ``_blit()``
+
+    Note:
+        PixelBuf accepts a flat RGB sequence for slice assignment and applies
+        the strip byte order and brightness in C, so frames stay in RGB order.
+    """
+    frame = bytearray(30)
+    r, g, b = color
+    for pos in positions:
+        _set_frame_pixel(frame, pos, r, g, b)
+    return frame
+
+
+def _build_pattern_frame(pattern, color):
+    """Build the expanding-ring frame for a breathing pattern (N rings for pattern N)."""
+    frame = bytearray(30)
+    r, g, b = color
+    for ring_pixels, scale in _PATTERN_RINGS[:pattern]:
+        ring_r = int(r * scale)
+        ring_g = int(g * scale)
+        ring_b = int(b * scale)
+        for pos in ring_pixels:
+            _set_frame_pixel(frame, pos, ring_r, ring_g, ring_b)
+    return frame
+
+
+# Precomputed frames - built once at import so button feedback is a single blit
+_ROUTINE_FRAMES = tuple(
+    _build_frame(range(n), color) for n, color in enumerate(_ROUTINE_COLORS, 1)
+)
+
+_MODE_FRAMES = tuple(
+    _build_frame(_MODE_POSITIONS[:n], color) for n, color in enumerate(_MODE_COLORS, 1)
+)
+
+_PATTERN_FRAMES = tuple(
+    _build_pattern_frame(n, color) for n, color in enumerate(_PATTERN_COLORS, 1)
+)
+
+# Scratch frame for the breathing fade-out, mutated in place each step
+_fade_buf = bytearray(30)
+
+
 def show_routine_feedback(routine):
     """Display visual feedback for routine selection.
 
@@ -281,22 +522,12 @@ def show_routine_feedback(routine):
     Visual Pattern:
         Lights up N pixels for routine N with routine-specific color.
     """
-    cp.pixels.fill((0, 0, 0))
-
-    routine_info = {
-        1: {"color": (100, 0, 255), "name": "UFO Intelligence"},
-        2: {"color": (0, 255, 100), "name": "Intergalactic Cruising"},
-        3: {"color": (0, 100, 255), "name": "Meditate"},
-        4: {"color": (255, 100, 0), "name": "Dance Party"}
-    }
-
-    info = routine_info.get(routine, {"color": (255, 255, 255), "name": "Unknown"})
-
-    for i in range(routine):
-        cp.pixels[i] = info["color"]
-
-    cp.pixels.show()
-    print("🚀 Routine %d: %s" % (routine, info["name"]))
+    if 1 <= routine <= 4:
+        _blit(_ROUTINE_FRAMES[routine - 1])
+    else:
+        # Rare path - build the white indicator on demand
+        _blit(_build_frame(range(max(0, min(routine, 10))), _UNKNOWN_COLOR))
+    print("🚀 Routine %d: %s" % (routine, _feedback_name(_ROUTINE_NAMES, routine)))
 
 
 def show_mode_feedback(mode):
@@ -308,92 +539,212 @@ def show_mode_feedback(mode):
     Visual Pattern:
         Uses quadrant positions (0, 3, 6, 9) with mode-specific colors.
     """
-    cp.pixels.fill((0, 0, 0))
-
-    mode_info = {
-        1: {"color": (255, 0, 0), "name": "Rainbow Wheel"},
-        2: {"color": (255, 0, 255), "name": "Pink Theme"},
-        3: {"color": (0, 0, 255), "name": "Blue Theme"},
-        4: {"color": (0, 255, 0), "name": "Green Theme"}
-    }
-
-    info = mode_info.get(mode, {"color": (255, 255, 255), "name": "Unknown"})
-
-    positions = [0, 3, 6, 9]
-    for i in range(mode):
-        if i < len(positions):
-            cp.pixels[positions[i]] = info["color"]
-
-    cp.pixels.show()
-    print("🎨 Mode %d: %s" % (mode, info["name"]))
+    if 1 <= mode <= 4:
+        _blit(_MODE_FRAMES[mode - 1])
+    else:
+        _blit(_build_frame(_MODE_POSITIONS[:max(0, mode)], _UNKNOWN_COLOR))
+    print("🎨 Mode %d: %s" % (mode, _feedback_name(_MODE_NAMES, mode)))
 
 
-def show_breathing_pattern_feedback(pattern):
+def show_breathing_pattern_feedback(pattern, dark_ms=0):
     """Display visual feedback for breathing pattern selection.
 
     Args:
         pattern (int): Breathing pattern number (1-4)
+        dark_ms (int): How long the ring stays dark after the fade-out
 
     Visual Pattern:
         Expanding rings from the center, pattern N uses N rings.
-        Includes smooth fade-out animation.
+        Includes smooth fade-out animation, run by ``_feedback`` from the
+        main loop rather than blocking here.
     """
-    cp.pixels.fill((0, 0, 0))
-
-    pattern_info = {
-        1: {"color": (0, 150, 255), "name": "4-7-8 Breathing"},
-        2: {"color": (100, 200, 100), "name": "Box Breathing"},
-        3: {"color": (200, 100, 200), "name": "Triangle Breathing"},
-        4: {"color": (255, 150, 0), "name": "Deep Relaxation"}
-    }
-
-    info = pattern_info.get(pattern, {"color": (255, 255, 255), "name": "Unknown"})
-
-    # Center pixels (always lit)
-    center_pixels = [4, 5]
-    for pos in center_pixels:
-        cp.pixels[pos] = info["color"]
-
-    # Ring 1 (pattern 2+)
-    if pattern >= 2:
-        ring1_pixels = [3, 6]
-        for pos in ring1_pixels:
-            cp.pixels[pos] = tuple(int(c * 0.6) for c in info["color"])
-
-    # Ring 2 (pattern 3+)
-    if pattern >= 3:
-        ring2_pixels = [2, 7]
-        for pos in ring2_pixels:
-            cp.pixels[pos] = tuple(int(c * 0.4) for c in info["color"])
-
-    # Ring 3 (pattern 4 only - full ring)
-    if pattern == 4:
-        ring3_pixels = [1, 8, 0, 9]
-        for pos in ring3_pixels:
-            cp.pixels[pos] = tuple(int(c * 0.2) for c in info["color"])
+    if 1 <= pattern <= 4:
+        frame = _PATTERN_FRAMES[pattern - 1]
+    else:
+        # White "Unknown" rings: just the center below 1, three rings above 4
+        frame = _build_pattern_frame(1 if pattern < 1 else 3, _UNKNOWN_COLOR)
+    _blit(frame)
+    print("🧘 Pattern %d: %s" % (pattern, _feedback_name(_PATTERN_NAMES, pattern)))
+    _feedback.start(1200, fade_frame=frame, dark_ms=dark_ms)
 
-    cp.pixels.show()
-    print("🧘 Pattern %d: %s" % (pattern, info["name"]))
-    time.sleep(1.2)
-
-    # Smooth fade out
-    for fade_step in range(10):
-        for i in range(10):
-            current_color = cp.pixels[i]
-            if current_color != (0, 0, 0):
-                faded_color = tuple(int(c * 0.8) for c in current_color)
-                cp.pixels[i] = faded_color
-        cp.pixels.show()
-        time.sleep(0.1)
 
-    cp.pixels.fill((0, 0, 0))
-    cp.pixels.show()
+class FeedbackAnimator:
+    """Non-blocking hold / fade / clear sequencing for button feedback.
+
+    Button handlers draw a feedback frame and call ``start()``; the main loop
+    calls ``update()`` every iteration instead of the handlers sleeping, so
+    the scheduler, sensors and buttons keep running during the animation.
+    The active routine is paused while ``update()`` reports the feedback as
+    active so it does not draw over the ring.
+    """
+
+    _IDLE = 0
+    _SHOWING = 1
+    _DARK = 2
+
+    _FADE_STEPS = 10
+    _FADE_STEP_MS = 100
+
+    def __init__(self):
+        """Initialize an idle animator."""
+        self._state = self._IDLE
+        self._deadline_ms = 0
+        self._fade_left = 0
+        self._dark_ms = 0
+
+    def start(self, hold_ms, fade_frame=None, dark_ms=0):
+        """Hold the frame currently shown, optionally fade it, then clear.
+
+        Args:
+            hold_ms (int): How long to hold the current frame
+            fade_frame (bytearray): Frame to fade out after the hold (None = just clear)
+            dark_ms (int): How long feedback keeps the ring dark after clearing
+        """
+        if fade_frame is None:
+            self._fade_left = 0
+        else:
+            _fade_buf[:] = fade_frame
+            self._fade_left = self._FADE_STEPS
+        self._dark_ms = dark_ms
+        self._state = self._SHOWING
+        self._deadline_ms = _ticks_ms() + hold_ms
+
+    def update(self, current_ms):
+        """Advance the animation.
+
+        Args:
+            current_ms (int): Current time from ``_ticks_ms()``
+
+        Returns:
+            bool: True while the feedback owns the pixel ring
+        """
+        state = self._state
+        if state == self._IDLE:
+            return False
+        if current_ms < self._deadline_ms:
+            return True
+
+        if state == self._DARK:
+            self._state = self._IDLE
+            return False
+
+        # Fade step - fixed-point x0.8 (205/256) on the shared scratch frame
+        if self._fade_left:
+            self._fade_left -= 1
+            for j in range(30):
+                _fade_buf[j] = (_fade_buf[j] * 205) >> 8
+            if any(_fade_buf):
+                _blit(_fade_buf)
+                self._deadline_ms = current_ms + self._FADE_STEP_MS
+                return True
+
+        # Hold/fade finished (or fully faded early) - clear, then stay dark
+        _blit(_ZERO30)
+        self._state = self._DARK
+        self._deadline_ms = current_ms + self._dark_ms
+        return True
+
+
+# Shared feedback animator driven by main()
+_feedback = FeedbackAnimator()
+
+
+def _load_ufo_intelligence(config, bt_debug, audio_debug):
+    """Load routine 1 - UFO Intelligence (validates AI subsystems)."""
+    print("[SYSTEM] 🛸 Loading UFO Intelligence...")
+    from ufo_intelligence import UFOIntelligence
+
+    # Persistent memory only if requested and the filesystem is writable
+    persist_this_run = bool(config.get('ufo_persistent_memory', False) and
+                            _fs_writable_check())
+
+    try:
+        instance = UFOIntelligence(
+            device_name=config.get('name', 'ILLO'),
+            debug_bluetooth=bt_debug,
+            debug_audio=audio_debug,
+            persistent_memory=persist_this_run,
+            college_spirit_enabled=config.get('college_spirit_enabled', False),
+            college=config.get('college', 'none')
+        )
+    except MemoryError:
+        print("[SYSTEM] 🚨 OUT OF MEMORY initializing UFO Intelligence")
+        print(
+            "[SYSTEM] 💡 Try: 1) Restart, 2) Disable persistent memory, 3) Use simpler routine")
+        return None
+
+    # Validate AI subsystems
+    if hasattr(instance, 'ai_core') and hasattr(instance,
+                                                'behaviors') and hasattr(
+        instance, 'learning'):
+        if instance.ai_core is None or instance.behaviors is None or instance.learning is None:
+            print("[SYSTEM] ❌ UFO Intelligence failed to initialize AI systems")
+            if hasattr(instance, 'cleanup'):
+                instance.cleanup()
+            return None
+
+    return instance
+
+
+def _load_intergalactic_cruising(config, bt_debug, audio_debug):
+    """Load routine 2 - Intergalactic Cruising (optional Bluetooth control)."""
+    print("[SYSTEM] 🌌 Loading Intergalactic Cruising...")
+    from intergalactic_cruising import IntergalacticCruising
+    instance = IntergalacticCruising()
+
+    if config.get('bluetooth_enabled', True) and hasattr(instance,
+                                                         'bluetooth') and instance.bluetooth:
+        print("[SYSTEM] 📱 Enabling Bluetooth control...")
+        instance.enable_bluetooth()
+    else:
+        print("[SYSTEM] ⚡ High-performance mode (Bluetooth disabled)")
+
+    return instance
+
+
+def _load_meditate(config, bt_debug, audio_debug):
+    """Load routine 3 - Meditate."""
+    print("[SYSTEM] 🧘 Loading Meditate...")
+    from meditate import Meditate
+    return Meditate(
+        adaptive_timing=config.get('meditate_adaptive_timing', True),
+        ultra_dim=config.get('meditate_ultra_dim', True)
+    )
+
+
+def _load_dance_party(config, bt_debug, audio_debug):
+    """Load routine 4 - Dance Party (BLE sync; role chosen by mode)."""
+    print("[SYSTEM] 💃 Loading Dance Party...")
+    from dance_party import DanceParty
+    instance = DanceParty(config.get('name', 'ILLO'), bt_debug, audio_debug)
+
+    if config.get('bluetooth_enabled', True) and hasattr(instance, 'enable_bluetooth'):
+        success = instance.enable_bluetooth()
+        if not success and bt_debug:
+            print("[SYSTEM] ⚠️ Dance Party Bluetooth init issue")
+
+    if bt_debug:
+        print(
+            "[SYSTEM] 📡 Role determined by Button B (Mode 1=Leader, 2-4=Follower)")
+
+    return instance
+
+
+# Routine number -> loader. Each loader does its own lazy import and setup,
+# so adding a routine means adding a loader here rather than another branch.
+_ROUTINE_LOADERS = {
+    1: _load_ufo_intelligence,
+    2: _load_intergalactic_cruising,
+    3: _load_meditate,
+    4: _load_dance_party
+}
 
 
 def create_routine_instance(routine, config, bt_debug, audio_debug):
     """Create a routine instance based on a routine number.
 
     Uses lazy imports to save memory by only loading the necessary routines.
+    Dispatches through ``_ROUTINE_LOADERS``.
 
     Args:
         routine (int): Routine number (1-4)
@@ -409,90 +760,15 @@ def create_routine_instance(routine, config, bt_debug, audio_debug):
         - UFO Intelligence validates AI subsystems after init
         - Returns None for invalid routine numbers
     """
-    if not 1 <= routine <= 4:
+    loader = _ROUTINE_LOADERS.get(routine)
+    if loader is None:
         print("[SYSTEM] ❌ Invalid routine number: %d (must be 1-4)" % routine)
         return None
 
-    instance = None
-
-    # Extract config values
-    name = config.get('name', 'ILLO')
-    bluetooth_enabled = config.get('bluetooth_enabled', True)
-    college_spirit_enabled = config.get('college_spirit_enabled', False)
-    college = config.get('college', 'none')
-    ufo_persistent_memory = config.get('ufo_persistent_memory', False)
-    meditate_adaptive_timing = config.get('meditate_adaptive_timing', True)
-    meditate_ultra_dim = config.get('meditate_ultra_dim', True)
-
-    # Check filesystem for UFO Intelligence only
-    _fs_is_writable = _fs_writable_check() if routine == 1 else False
-    _persist_this_run = bool(ufo_persistent_memory and _fs_is_writable)
-
     try:
-        if routine == 1:
-            print("[SYSTEM] 🛸 Loading UFO Intelligence...")
-            from ufo_intelligence import UFOIntelligence
+        instance = loader(config, bt_debug, audio_debug)
 
-            try:
-                instance = UFOIntelligence(
-                    device_name=name,
-                    debug_bluetooth=bt_debug,
-                    debug_audio=audio_debug,
-                    persistent_memory=_persist_this_run,
-                    college_spirit_enabled=college_spirit_enabled,
-                    college=college
-                )
-            except MemoryError:
-                print("[SYSTEM] 🚨 OUT OF MEMORY initializing UFO Intelligence")
-                print(
-                    "[SYSTEM] 💡 Try: 1) Restart, 2) Disable persistent memory, 3) Use simpler routine")
-                return None
-
-            # Validate AI subsystems
-            if hasattr(instance, 'ai_core') and hasattr(instance,
-                                                        'behaviors') and hasattr(
-                instance, 'learning'):
-                if instance.ai_core is None or instance.behaviors is None or instance.learning is None:
-                    print("[SYSTEM] ❌ UFO Intelligence failed to initialize AI systems")
-                    if hasattr(instance, 'cleanup'):
-                        instance.cleanup()
-                    return None
-
-        elif routine == 2:
-            print("[SYSTEM] 🌌 Loading Intergalactic Cruising...")
-            from intergalactic_cruising import IntergalacticCruising
-            instance = IntergalacticCruising()
-
-            if bluetooth_enabled and hasattr(instance,
-                                             'bluetooth') and instance.bluetooth:
-                print("[SYSTEM] 📱 Enabling Bluetooth control...")
-                instance.enable_bluetooth()
-            else:
-                print("[SYSTEM] ⚡ High-performance mode (Bluetooth disabled)")
-
-        elif routine == 3:
-            print("[SYSTEM] 🧘 Loading Meditate...")
-            from meditate import Meditate
-            instance = Meditate(
-                adaptive_timing=meditate_adaptive_timing,
-                ultra_dim=meditate_ultra_dim
-            )
-
-        elif routine == 4:
-            print("[SYSTEM] 💃 Loading Dance Party...")
-            from dance_party import DanceParty
-            instance = DanceParty(name, bt_debug, audio_debug)
-
-            if bluetooth_enabled and hasattr(instance, 'enable_bluetooth'):
-                success = instance.enable_bluetooth()
-                if not success and bt_debug:
-                    print("[SYSTEM] ⚠️ Dance Party Bluetooth init issue")
-
-            if bt_debug:
-                print(
-                    "[SYSTEM] 📡 Role determined by Button B (Mode 1=Leader, 2-4=Follower)")
-
-        if instance:
+        if instance and _VERBOSE:
             print("[SYSTEM] ✅ Routine %d loaded successfully" % routine)
 
         return instance
@@ -500,63 +776,110 @@ def create_routine_instance(routine, config, bt_debug, audio_debug):
     except ImportError as import_err:
         print("[SYSTEM] ❌ Import error: %s" % str(import_err))
         print("[SYSTEM] 💡 Check that all required files are on CIRCUITPY")
-        if instance and hasattr(instance, 'cleanup'):
-            instance.cleanup()
         return None
 
     except MemoryError as mem_err:
         print("[SYSTEM] ❌ Memory error: %s" % str(mem_err))
         print("[SYSTEM] 💡 Try restarting or using a simpler routine")
-        if instance and hasattr(instance, 'cleanup'):
-            instance.cleanup()
-        import gc
         gc.collect()
         return None
 
     except Exception as e:
         print("[SYSTEM] ❌ Unexpected error: %s" % str(e))
-        if instance and hasattr(instance, 'cleanup'):
-            instance.cleanup()
         return None
 
 
-def handle_button_interactions(routine, mode, last_button_a_time, last_button_b_time,
-                               button_debounce_delay, current_time):
+# cp's private button inputs and the board pins behind them
+_CP_BUTTON_PINS = (('_a', 'BUTTON_A'), ('_b', 'BUTTON_B'))
+
+
+def _create_button_keys():
+    """Create an event-driven scanner for Buttons A and B.
+
+    Returns:
+        keypad.Keys or None: Scanner with key 0 = Button A, key 1 = Button B,
+        or None if keypad is unavailable (buttons are then polled via cp)
+
+    Note:
+        adafruit_circuitplayground claims the button pins at import, so they
+        are released before keypad takes them over. keypad debounces in the
+        background and queues presses, so presses made during a blocking
+        time.sleep() are not lost. If keypad cannot take the pins, cp's
+        buttons are re-created so polling still works.
+    """
+    if not _HAS_KEYPAD:
+        return None
+
+    released = []
+    try:
+        for attr, pin_name in _CP_BUTTON_PINS:
+            getattr(cp, attr).deinit()
+            released.append((attr, pin_name))
+        return keypad.Keys((board.BUTTON_A, board.BUTTON_B),
+                           value_when_pressed=True, pull=True)
+    except (AttributeError, ValueError) as keys_err:
+        print("[SYSTEM] ⚠️ Button events unavailable, polling instead: %s" % str(keys_err))
+        _restore_cp_buttons(released)
+        return None
+
+
+def _restore_cp_buttons(released):
+    """Re-create cp's button inputs that were released for keypad.
+
+    Args:
+        released (list): (cp attribute, board pin name) pairs to re-create
+
+    Note:
+        Matches adafruit_circuitplayground's setup - pulled-down inputs that
+        read True while pressed - so cp.button_a/button_b polling works again.
+    """
+    for attr, pin_name in released:
+        try:
+            button = digitalio.DigitalInOut(getattr(board, pin_name))
+            button.switch_to_input(pull=digitalio.Pull.DOWN)
+            setattr(cp, attr, button)
+        except (AttributeError, ValueError) as pin_err:
+            print("[SYSTEM] ❌ Cannot restore %s: %s" % (pin_name, str(pin_err)))
+
+
+def handle_button_interactions(button_a, button_b, routine, mode, last_button_a_ms,
+                               last_button_b_ms, button_debounce_ms, current_ms, config):
     """Handle button A and B interactions with debouncing.
 
     Button A cycles routines and reboots. Button B cycles modes.
+    Only called when at least one button press was seen this loop.
 
     Args:
+        button_a (bool): Button A pressed this loop
+        button_b (bool): Button B pressed this loop
         routine (int): Current routine (1-4)
         mode (int): Current mode (1-4)
-        last_button_a_time (float): Last Button A press timestamp
-        last_button_b_time (float): Last Button B press timestamp
-        button_debounce_delay (float): Debounce delay in seconds
-        current_time (float): Current monotonic time
+        last_button_a_ms (int): Last Button A press timestamp (ms)
+        last_button_b_ms (int): Last Button B press timestamp (ms)
+        button_debounce_ms (int): Debounce delay in milliseconds
+        current_ms (int): Current time from ``_ticks_ms()``
+        config (dict): Live configuration dictionary (updated in place on save)
 
     Returns:
-        tuple: (new_routine, new_mode, new_last_button_a_time,
-                new_last_button_b_time, config_changed)
+        tuple: (new_routine, new_mode, new_last_button_a_ms,
+                new_last_button_b_ms, config_changed)
     """
     config_changed = False
 
     # Button A: Routine selection (with reboot)
-    if cp.button_a and (current_time - last_button_a_time > button_debounce_delay):
+    if button_a and (current_ms - last_button_a_ms > button_debounce_ms):
         routine = (routine % 4) + 1
         show_routine_feedback(routine)
         print("🔄 Switching to routine %d - saving and rebooting..." % routine)
 
         try:
-            config_mgr = ConfigManager()
-            config = config_mgr.load_config()
             config['routine'] = routine
-            success = config_mgr.save_config(config)
+            success = save_config(config, durable=True)
 
             if success:
                 print("💾 Routine %d saved successfully" % routine)
                 time.sleep(1.5)
-                cp.pixels.fill((0, 0, 0))
-                cp.pixels.show()
+                _blit(_ZERO30)
                 print("🚀 Rebooting...")
                 time.sleep(0.5)
 
@@ -573,73 +896,66 @@ def handle_button_interactions(routine, mode, last_button_a_time, last_button_b_
             print("❌ Error during save: %s" % str(e))
             config_changed = True
 
-        last_button_a_time = current_time
-        time.sleep(0.8)
-        cp.pixels.fill((0, 0, 0))
-        cp.pixels.show()
+        last_button_a_ms = current_ms
+        _feedback.start(800)
 
     # Button B: Mode selection
-    if cp.button_b and (current_time - last_button_b_time > button_debounce_delay):
+    if button_b and (current_ms - last_button_b_ms > button_debounce_ms):
         mode = (mode % 4) + 1
         show_mode_feedback(mode)
         config_changed = True
 
-        # Special feedback for Meditate
+        # Special feedback for Meditate (fade-out, then the usual dark pause)
         if routine == 3:
-            show_breathing_pattern_feedback(mode)
-            breathing_patterns = {
-                1: "4-7-8 Breathing",
-                2: "Box Breathing",
-                3: "Triangle Breathing",
-                4: "Deep Relaxation"
-            }
-            print("[MEDITATE] 🧘 Mode %d = %s" % (mode, breathing_patterns.get(mode,
-                                                                              "Unknown")))
-
-        time.sleep(0.8)
-        cp.pixels.fill((0, 0, 0))
-        cp.pixels.show()
-        last_button_b_time = current_time
+            show_breathing_pattern_feedback(mode, dark_ms=800)
+            print("[MEDITATE] 🧘 Mode %d = %s" % (mode, _feedback_name(_PATTERN_NAMES, mode)))
+        else:
+            _feedback.start(800)
+
+        last_button_b_ms = current_ms
+
+    return routine, mode, last_button_a_ms, last_button_b_ms, config_changed
 
-    return routine, mode, last_button_a_time, last_button_b_time, config_changed
 
+# Attributes handle_ufo_intelligence_learning relies on; checked once when
+# the hook is installed rather than with hasattr() on every interaction
+_UFO_LEARNING_ATTRS = ('last_interaction', 'energy_level', 'mood',
+                       'record_successful_attention')
 
-def handle_ufo_intelligence_learning(routine, current_routine_instance, interactions):
+
+def handle_ufo_intelligence_learning(current_routine_instance, interactions, current_ms):
     """Handle UFO Intelligence learning from interactions.
 
-    Only active for routine 1 (UFO Intelligence).
+    Only installed as the main loop's learning hook while routine 1
+    (UFO Intelligence) is loaded and the instance provides every attribute
+    in ``_UFO_LEARNING_ATTRS``, so it does not re-check either.
 
     Args:
-        routine (int): Current routine number
-        current_routine_instance (object): Active routine instance
-        interactions (dict): Detected interactions from InteractionManager
+        current_routine_instance (object): Active UFO Intelligence instance
+        interactions (tuple): (tap, shake, light) from InteractionManager
+        current_ms (int): ``_ticks_ms()`` captured at the top of the main loop
     """
-    if routine != 1 or not current_routine_instance:
-        return
+    tap, shake, light = interactions
 
     # Update last interaction time
-    if interactions['tap'] or interactions['shake']:
-        if hasattr(current_routine_instance, 'last_interaction'):
-            current_routine_instance.last_interaction = time.monotonic()
-        if (hasattr(current_routine_instance, 'record_successful_attention') and
-                getattr(current_routine_instance, 'mood', None) == "curious"):
+    if tap or shake:
+        current_routine_instance.last_interaction = current_ms / 1000.0
+        if current_routine_instance.mood == "curious":
             current_routine_instance.record_successful_attention()
 
     # Shake boosts energy
-    if interactions['shake']:
-        if hasattr(current_routine_instance, 'energy_level'):
-            old_energy = current_routine_instance.energy_level
-            current_routine_instance.energy_level = min(100,
-                                                        current_routine_instance.energy_level + 15)
-            if debug_interactions:
-                print("[UFO AI] ⚡ Energy: %d -> %d" % (old_energy,
-                                                       current_routine_instance.energy_level))
+    if shake:
+        old_energy = current_routine_instance.energy_level
+        current_routine_instance.energy_level = min(100, old_energy + 15)
+        if debug_interactions:
+            print("[UFO AI] ⚡ Energy: %d -> %d" % (old_energy,
+                                                   current_routine_instance.energy_level))
 
     # Light interactions
-    if interactions.get('light_interaction', False):
-        print("[UFO AI] 💡 Light interaction detected!")
-        if hasattr(current_routine_instance, 'last_interaction'):
-            current_routine_instance.last_interaction = time.monotonic()
+    if light:
+        if _VERBOSE:
+            print("[UFO AI] 💡 Light interaction detected!")
+        current_routine_instance.last_interaction = current_ms / 1000.0
 
 
 def main():
@@ -651,8 +967,7 @@ def main():
     print("[SYSTEM] 🚀 ILLO v%s - Starting..." % VERSION)
 
     # Initialize managers
-    config_mgr = ConfigManager()
-    config = config_mgr.load_config()
+    config = load_config()
     memory_mgr = MemoryManager(enable_debug=debug_memory)
     interaction_mgr = InteractionManager(enable_debug=debug_interactions)
     scheduler = TaskScheduler()
@@ -668,11 +983,15 @@ def main():
 
     # State tracking
     current_routine_instance = None
+    learning_hook = None  # Per-routine interaction hook (UFO Intelligence only)
     active_routine_number = 0
-    last_button_a_time = 0.0
-    last_button_b_time = 0.0
-    button_debounce_delay = 0.3
+    last_button_a_ms = 0
+    last_button_b_ms = 0
+    button_debounce_ms = 300
     config_changed = False
+    config_dirty_since_ms = 0  # When the pending config change was last made
+    last_config_save_ms = None
+    last_saved_config = dict(config)
 
     # Define scheduled tasks
     def memory_cleanup_task():
@@ -680,25 +999,42 @@ def main():
         memory_mgr.periodic_cleanup()
 
     def config_save_task():
-        """Save config if changes pending."""
-        nonlocal config_changed, config, routine, mode
-        if config_changed:
-            config['routine'] = routine
-            config['mode'] = mode
-            success = config_mgr.save_config(config)
-            if success:
-                config_changed = False
-                if debug_memory:
-                    print("[SCHEDULER] 💾 Config auto-saved")
+        """Save config once pending changes have settled.
+
+        Rapid Button B presses are coalesced into a single write, writes
+        are spaced at least ``_CONFIG_MIN_SAVE_GAP_MS`` apart to limit flash
+        wear, and a change that ends where it started (e.g. cycling back to
+        the saved mode) is dropped without touching flash. Routine changes
+        save immediately from the Button A handler since they reboot.
+        """
+        nonlocal config_changed, last_saved_config, last_config_save_ms
+        if not config_changed:
+            return
+        now_ms = _ticks_ms()
+        if not _config_save_due(now_ms, config_dirty_since_ms, last_config_save_ms):
+            return
+
+        config['routine'] = routine
+        config['mode'] = mode
+        if config == last_saved_config:
+            config_changed = False
+            return
+
+        success = save_config(config)
+        last_config_save_ms = now_ms
+        if success:
+            config_changed = False
+            last_saved_config = dict(config)
+            if debug_memory:
+                print("[SCHEDULER] 💾 Config auto-saved")
 
     def system_status_task():
         """Report system status."""
-        import gc
         print("[SCHEDULER] 📊 Memory: %d bytes, Routine: %d, Mode: %d" %
               (gc.mem_free(), routine, mode))
 
     # Add tasks to a scheduler
-    scheduler.add_task('memory_cleanup', 30.0, memory_cleanup_task)
+    memory_cleanup_slot = scheduler.add_task('memory_cleanup', 30.0, memory_cleanup_task)
     scheduler.add_task('config_save', 3.0, config_save_task)
     scheduler.add_task('system_status', 60.0, system_status_task, enabled=debug_memory)
 
@@ -717,8 +1053,27 @@ def main():
 
     cp.detect_taps = 1
 
+    # Button presses arrive as keypad events (polled through cp as a fallback)
+    button_keys = _create_button_keys()
+    if button_keys is not None:
+        button_events = button_keys.events
+        key_event = keypad.Event()  # Reused by get_into() - no allocation per event
+
+    # Hot-loop bindings - avoid repeated global/attribute lookups per iteration
+    pixels = cp.pixels
+    ticks_ms = _ticks_ms
+    check_interactions = interaction_mgr.check_interactions
+    update_feedback = _feedback.update
+    run_due_tasks = scheduler.run_due_tasks
+
+    # The slide switch only changes by hand, so sample it a few times a
+    # second instead of reading the pin every iteration
+    volume = actual_volume
+    switch_poll_ms = 100
+    next_switch_ms = 0
+
     # Performance tracking (debug only)
-    loop_start_time = time.monotonic()
+    loop_start_ms = ticks_ms()
     loop_count = 0
     performance_report_interval = 100
 
@@ -726,30 +1081,41 @@ def main():
 
     # Main event loop
     while True:
-        current_time = time.monotonic()
-        volume = cp.switch
+        current_ms = ticks_ms()
+        if current_ms >= next_switch_ms:
+            volume = cp.switch
+            next_switch_ms = current_ms + switch_poll_ms
         loop_count += 1
 
         # Routine switching
         if routine != active_routine_number:
-            print("[SYSTEM] 🔄 Switching routines...")
+            if _VERBOSE:
+                print("[SYSTEM] 🔄 Switching routines...")
 
             # Clean up old routine
             if current_routine_instance:
-                if hasattr(current_routine_instance, 'cleanup'):
+                cleanup = getattr(current_routine_instance, 'cleanup', None)
+                if cleanup is not None:
                     try:
-                        current_routine_instance.cleanup()
+                        cleanup()
                     except Exception as cleanup_err:
                         print("[SYSTEM] ⚠️ Cleanup error: %s" % str(cleanup_err))
+                cleanup = None
 
                 memory_mgr.cleanup_before_routine_change()
                 del current_routine_instance
 
-                import gc
-                gc.collect()
-                print("[SYSTEM] 💾 Memory freed: %d bytes available" % gc.mem_free())
+                # Collect again only if the heap is actually tight; a forced
+                # collection on a healthy heap just adds pause time
+                free_mem = gc.mem_free()
+                if free_mem < _GC_THRESHOLD:
+                    gc.collect()
+                    free_mem = gc.mem_free()
+                if _VERBOSE:
+                    print("[SYSTEM] 💾 Memory freed: %d bytes available" % free_mem)
 
             # Set up a new routine
+            learning_hook = None
             interaction_mgr.setup_for_routine(routine)
             current_routine_instance = create_routine_instance(
                 routine, config, debug_bluetooth, debug_audio
@@ -760,51 +1126,76 @@ def main():
 
                 # Adjust memory cleanup interval
                 if routine == 1:
-                    scheduler.tasks['memory_cleanup']['interval'] = 20.0
+                    if all(hasattr(current_routine_instance, attr)
+                           for attr in _UFO_LEARNING_ATTRS):
+                        learning_hook = handle_ufo_intelligence_learning
+                    scheduler.set_interval_at(memory_cleanup_slot, 20.0)
                 else:
-                    scheduler.tasks['memory_cleanup']['interval'] = 30.0
+                    scheduler.set_interval_at(memory_cleanup_slot, 30.0)
             else:
                 print("[SYSTEM] ❌ Failed to load routine %d" % routine)
 
+        # Button feedback owns the ring while active: interactions are still
+        # detected, but their pixel actions would draw over the feedback
+        feedback_active = update_feedback(current_ms)
+
         # Check interactions
-        interactions = interaction_mgr.check_interactions(routine, volume, cp.pixels)
-        handle_ufo_intelligence_learning(routine, current_routine_instance,
-                                         interactions)
-
-        # Handle buttons
-        routine, mode, last_button_a_time, last_button_b_time, config_changed_by_button = \
-            handle_button_interactions(
-                routine, mode, last_button_a_time, last_button_b_time,
-                button_debounce_delay, current_time
+        interactions = check_interactions(routine, volume, pixels, not feedback_active)
+        if learning_hook:
+            learning_hook(current_routine_instance, interactions, current_ms)
+
+        # Handle buttons - drain queued keypad presses, or poll without keypad
+        if button_keys is None:
+            button_a = cp.button_a
+            button_b = cp.button_b
+        else:
+            button_a = button_b = False
+            while button_events.get_into(key_event):
+                if key_event.pressed:
+                    if key_event.key_number == 0:
+                        button_a = True
+                    else:
+                        button_b = True
+
+        if button_a or button_b:
+            (routine, mode, last_button_a_ms, last_button_b_ms,
+             config_changed_by_button) = handle_button_interactions(
+                button_a, button_b, routine, mode, last_button_a_ms, last_button_b_ms,
+                button_debounce_ms, current_ms, config
             )
 
-        if config_changed_by_button:
-            config['routine'] = routine
-            config['mode'] = mode
-            config_changed = True
+            if config_changed_by_button:
+                config['routine'] = routine
+                config['mode'] = mode
+                config_changed = True
+                config_dirty_since_ms = current_ms
 
-        # Run active routine
-        if current_routine_instance:
+            # A press may have just started feedback
+            feedback_active = update_feedback(current_ms)
+
+        # Run active routine (paused while button feedback owns the ring)
+        if current_routine_instance and not feedback_active:
             try:
                 current_routine_instance.run(mode, volume)
             except MemoryError as mem_err:
                 print("[SYSTEM] 🚨 Memory error during routine: %s" % str(mem_err))
-                import gc
                 gc.collect()
                 print("[SYSTEM] 💾 Emergency cleanup: %d bytes free" % gc.mem_free())
             except Exception as routine_err:
                 print("[SYSTEM] ❌ Routine error: %s" % str(routine_err))
 
-        # Run scheduled tasks
-        scheduler.run_due_tasks(current_time)
+        # Run scheduled tasks (skip the call until the earliest deadline)
+        next_due_ms = scheduler.next_due_ms
+        if next_due_ms is not None and current_ms >= next_due_ms:
+            run_due_tasks(current_ms)
 
         # Performance monitoring (debug)
         if debug_memory and loop_count % performance_report_interval == 0:
-            elapsed = current_time - loop_start_time
-            if elapsed > 0:
-                loops_per_second = performance_report_interval / elapsed
+            elapsed_ms = current_ms - loop_start_ms
+            if elapsed_ms > 0:
+                loops_per_second = performance_report_interval * 1000.0 / elapsed_ms
                 print("[SCHEDULER] 🚀 Performance: %.1f loops/sec" % loops_per_second)
-            loop_start_time = current_time
+            loop_start_ms = current_ms
 
 
 if __name__ == "__main__":
@@ -817,8 +1208,7 @@ if __name__ == "__main__":
         main()
     except KeyboardInterrupt:
         print("\n[SYSTEM] ⏹️ Keyboard interrupt")
-        cp.pixels.fill((0, 0, 0))
-        cp.pixels.show()
+        _blit(_ZERO30)
         print("[SYSTEM] 👋 Goodbye!")
     except Exception as fatal_err:
         print("\n[SYSTEM] 💥 FATAL ERROR: %s" % str(fatal_err))
@@ -827,6 +1217,5 @@ if __name__ == "__main__":
             cp.pixels.fill((255, 0, 0))
             cp.pixels.show()
             time.sleep(0.2)
-            cp.pixels.fill((0, 0, 0))
-            cp.pixels.show()
+            _blit(_ZERO30)
             time.sleep(0.2)
@@ -32,80 +32,106 @@ Note:
     fight_song, and chants fields.
 """
 
+import gc
 import json
 
+# Defaults used when no college is loaded (tuples, so callers cannot mutate them)
+_DEFAULT_PRIMARY = (255, 255, 255)
+_DEFAULT_SECONDARY = (128, 128, 128)
+_DEFAULT_TONE = (200, 0.3)
+_DEFAULT_BPM = 120
+
+
 class CollegeManager:
     def __init__(self, college_name="none"):
         self.college_name = college_name
-        self.college_data = None
+        self._loaded = False
+        self._name = "Generic"
+        self._colors = None
+        self._chant_data = None
+        self._fight_song_notes = []
+        self._fight_song_bpm = _DEFAULT_BPM
+        self._audio_tones = {}
         self.load_college_data()
     
     def load_college_data(self):
-        """Load college-specific data from JSON file."""
+        """Load college-specific data from JSON file.
+
+        Only the fields the accessors need are kept; the parsed document is
+        dropped and collected so it does not stay resident on the heap.
+        """
         if self.college_name == "none":
-            self.college_data = None
+            self._loaded = False
             return
             
         try:
             file_path = 'colleges/{}.json'.format(self.college_name)
             with open(file_path, 'r') as f:
-                self.college_data = json.load(f)
-        except (OSError, ValueError) as e:
+                data = json.load(f)
+
+            fight_song = data["fight_song"]
+            self._name = data["name"]
+            self._colors = data["colors"]
+            self._chant_data = data.get("chants", {}).get("primary")
+            self._fight_song_notes = fight_song["notes"]
+            self._fight_song_bpm = fight_song.get("bpm", _DEFAULT_BPM)
+            self._audio_tones = data.get("audio_tones", {})
+            self._loaded = True
+        except (OSError, ValueError, KeyError) as e:
             print("[COLLEGE] ❌ Could not load college data: {}".format(str(e)))
-            self.college_data = None
+            self._loaded = False
+
+        data = None
+        gc.collect()
     
     def is_enabled(self):
         """Check if college spirit is enabled and loaded."""
-        return self.college_data is not None
+        return self._loaded
     
     def get_colors(self):
         """Get college colors."""
-        if not self.college_data:
-            return {"primary": [255, 255, 255], "secondary": [128, 128, 128]}
-        return self.college_data["colors"]
+        if not self._loaded:
+            return {"primary": _DEFAULT_PRIMARY, "secondary": _DEFAULT_SECONDARY}
+        return self._colors
     
     def get_chant_data(self):
         """Get chant detection parameters."""
-        if not self.college_data:
-            return None
-        
-        if "chants" not in self.college_data:
-            return None
-            
-        if "primary" not in self.college_data["chants"]:
+        if not self._loaded:
             return None
-            
-        chant_data = self.college_data["chants"]["primary"]
-        return chant_data
+        return self._chant_data
     
     def get_fight_song_notes(self):
         """Get fight song note sequence."""
-        if not self.college_data:
+        if not self._loaded:
             return []
-        return self.college_data["fight_song"]["notes"]
+        return self._fight_song_notes
+
+    def get_fight_song_bpm(self):
+        """Get fight song tempo (defaults to 120 BPM)."""
+        if not self._loaded:
+            return _DEFAULT_BPM
+        return self._fight_song_bpm
     
     def get_response_tone(self, tone_type="chant_response"):
         """Get audio tone for specific response type."""
-        if not self.college_data:
-            return [200, 0.3]  # Default tone
-        return self.college_data["audio_tones"].get(tone_type, [200, 0.3])
+        if not self._loaded:
+            return _DEFAULT_TONE  # Default tone
+        return self._audio_tones.get(tone_type, _DEFAULT_TONE)
     
     def get_college_name(self):
         """Get full college name."""
-        if not self.college_data:
+        if not self._loaded:
             return "Generic"
-        return self.college_data["name"]
+        return self._name
 
     def get_chant_notes(self):
         """Get chant note sequence."""
-        if not self.college_data:
-            return []
-        
-        if "chants" not in self.college_data:
+        if not self._loaded or self._chant_data is None:
             return []
-            
-        if "primary" not in self.college_data["chants"]:
-            return []
-        
-        chant_data = self.college_data["chants"]["primary"]
-        return chant_data.get("notes", [])
+        return self._chant_data.get("notes", [])
+
+    def get_chant_bpm(self):
+        """Get chant tempo (defaults to 120 BPM)."""
+        if not self._loaded or self._chant_data is None:
+            return _DEFAULT_BPM
+        return self._chant_data.get("bpm", _DEFAULT_BPM)
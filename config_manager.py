@@ -1,97 +1,142 @@
 import json
+import os
 
+# Print a confirmation for every successful save (errors always print)
+_VERBOSE = False
 
-class ConfigManager:
+_CONFIG_PATH = 'config.json'
+_CONFIG_TMP_PATH = 'config.json.tmp'
 
-    @staticmethod
-    def load_config():
-        """
-        Load configuration from the config.json file.
-        Returns simplified config without debug flags and volume.
-        """
-        try:
-            with open('config.json') as config_file:
-                data = json.load(config_file)
-
-            return {
-                'name': data.get('name', 'ILLO'),
-                'routine': data['routine'],
-                'mode': data['mode'],
-                'bluetooth_enabled': data.get('bluetooth_enabled', True),
-                'college': data.get('college', 'none'),
-                'college_spirit_enabled': data.get('college_spirit_enabled', False),
-                'ufo_persistent_memory': data.get('ufo_persistent_memory', True),
-                'meditate_adaptive_timing': data.get('meditate_adaptive_timing', True),
-                'meditate_ultra_dim': data.get('meditate_ultra_dim', True),
-                'college_chant_detection_enabled': data.get(
-                    'college_chant_detection_enabled', False)
-            }
-        except Exception as e:
-            print("[CONFIG] ❌ Failed to load config: %s" % str(e))
-            # Return defaults
-            return {
-                'name': 'ILLO',
-                'routine': 1,
-                'mode': 1,
-                'bluetooth_enabled': True,
-                'college': 'none',
-                'college_spirit_enabled': False,
-                'ufo_persistent_memory': True,
-                'meditate_adaptive_timing': True,
-                'meditate_ultra_dim': True,
-                'college_chant_detection_enabled': False
-            }
-
-    @staticmethod
-    def save_config(config):
-        """
-        Save current configuration to config.json file.
-
-        Args:
-            config: Dictionary with configuration values
-        """
+# Last config read from or written to disk (None until first load). Only
+# save_config() changes config.json while code.py runs - edits over USB
+# trigger an auto-reload - so the cache never needs an mtime check.
+_cached_config = None
+
+# Keys written to config.json, in file order
+_SAVED_KEYS = (
+    'name', 'routine', 'mode', 'bluetooth_enabled', 'college',
+    'college_spirit_enabled', 'ufo_persistent_memory', 'meditate_adaptive_timing',
+    'meditate_ultra_dim', 'college_chant_detection_enabled'
+)
+
+# Factory defaults, shared by load and save (never mutated - copy before use)
+_DEFAULTS = {
+    'name': 'ILLO',
+    'routine': 1,
+    'mode': 1,
+    'bluetooth_enabled': True,
+    'college': 'none',
+    'college_spirit_enabled': False,
+    'ufo_persistent_memory': True,
+    'meditate_adaptive_timing': True,
+    'meditate_ultra_dim': True,
+    'college_chant_detection_enabled': False
+}
+
+
+def _read_json(path):
+    """Read a small JSON file in one call and parse it from memory.
+
+    json.load() on a stream pulls it through the parser a byte at a time.
+    """
+    with open(path) as json_file:
+        return json.loads(json_file.read())
+
+
+def _replace_file(src, dst):
+    """Move ``src`` over ``dst``.
+
+    CircuitPython has no os.replace() and its FAT rename refuses to
+    overwrite, so the old file is removed first. If power drops between
+    the two steps, only ``src`` remains and load_config() falls back to it.
+    """
+    if hasattr(os, 'replace'):
+        os.replace(src, dst)
+        return
+    try:
+        os.remove(dst)
+    except OSError:
+        pass
+    os.rename(src, dst)
+
+
+def load_config():
+    """
+    Load configuration from the config.json file.
+    Returns simplified config without debug flags and volume.
+
+    The file is parsed once per boot; later calls (routines load their
+    own settings) return a copy of the cached result.
+    """
+    global _cached_config
+    if _cached_config is not None:
+        return dict(_cached_config)
+
+    try:
         try:
-            config_data = {
-                'name': config.get('name', 'ILLO'),
-                'routine': config.get('routine', 1),
-                'mode': config.get('mode', 1),
-                'bluetooth_enabled': config.get('bluetooth_enabled', True),
-                'college': config.get('college', 'none'),
-                'college_spirit_enabled': config.get('college_spirit_enabled', True),
-                'ufo_persistent_memory': config.get('ufo_persistent_memory', True),
-                'meditate_adaptive_timing': config.get('meditate_adaptive_timing',
-                                                       True),
-                'meditate_ultra_dim': config.get('meditate_ultra_dim', True),
-                'is_leader': config.get('is_leader', False),
-                'college_chant_detection_enabled': config.get(
-                    'college_chant_detection_enabled', False)
-            }
-            with open('config.json', 'w') as config_file:
-                config_file.write('{\n')
-                config_file.write('  "name": "%s",\n' % config_data['name'])
-                config_file.write('  "routine": %d,\n' % config_data['routine'])
-                config_file.write('  "mode": %d,\n' % config_data['mode'])
-                config_file.write('  "bluetooth_enabled": %s,\n' % str(
-                    config_data['bluetooth_enabled']).lower())
-                config_file.write('  "college": "%s",\n' % config_data['college'])
-                config_file.write('  "college_spirit_enabled": %s,\n' % str(
-                    config_data['college_spirit_enabled']).lower())
-                config_file.write('  "ufo_persistent_memory": %s,\n' % str(
-                    config_data['ufo_persistent_memory']).lower())
-                config_file.write('  "meditate_adaptive_timing": %s,\n' % str(
-                    config_data['meditate_adaptive_timing']).lower())
-                config_file.write('  "meditate_ultra_dim": %s,\n' % str(
-                    config_data['meditate_ultra_dim']).lower())
-                config_file.write('  "college_chant_detection_enabled": %s\n' % str(
-                    config_data['college_chant_detection_enabled']).lower())
-                config_file.write('}\n')
+            data = _read_json(_CONFIG_PATH)
+        except OSError:
+            # A save interrupted mid-publish leaves only the temp file
+            data = _read_json(_CONFIG_TMP_PATH)
+
+        config = {key: data.get(key, _DEFAULTS[key]) for key in _SAVED_KEYS}
+        # Routine and mode are required; a file without them is treated as bad
+        config['routine'] = data['routine']
+        config['mode'] = data['mode']
+
+        _cached_config = config
+        return dict(config)
+    except (OSError, ValueError, KeyError, AttributeError) as e:
+        # Missing/unreadable file, bad JSON, missing routine/mode, or a
+        # top-level value that isn't an object - fall back to defaults
+        print("[CONFIG] ❌ Failed to load config: %s" % str(e))
+        # Return defaults
+        return dict(_DEFAULTS)
+
+
+def save_config(config, durable=False):
+    """
+    Save current configuration to config.json file.
 
+    Args:
+        config: Dictionary with configuration values
+        durable: Flush filesystem caches before returning. Pass True when
+            the device is about to reset (e.g. routine change) so the
+            write can't be lost; routine auto-saves can skip the cost.
+    """
+    global _cached_config
+    try:
+        # Defaults overlaid with the caller's values in one C-level update;
+        # only _SAVED_KEYS are written below, so extra keys are ignored
+        config_data = dict(_DEFAULTS)
+        config_data.update(config)
+
+        # Nothing to do if the file already holds these values
+        if _cached_config is not None and all(
+                config_data[key] == _cached_config[key] for key in _SAVED_KEYS):
+            return True
+
+        # One key per line keeps the file easy to hand-edit on CIRCUITPY;
+        # json.dumps() handles string escaping and true/false/number output.
+        # The text is assembled first so the file gets a single write().
+        payload = '{\n%s\n}\n' % ',\n'.join(
+            '  "%s": %s' % (key, json.dumps(config_data[key])) for key in _SAVED_KEYS)
+        # Write the new file beside the old one, then swap it in, so a
+        # power cut mid-write never leaves a truncated config.json
+        with open(_CONFIG_TMP_PATH, 'w') as config_file:
+            config_file.write(payload)
+        _replace_file(_CONFIG_TMP_PATH, _CONFIG_PATH)
+        if durable and hasattr(os, 'sync'):
+            os.sync()
+        _cached_config = {key: config_data[key] for key in _SAVED_KEYS}
+
+        if _VERBOSE:
             print(
                 "[CONFIG] ⚙️ Configuration saved: Routine %d, Mode %d, BT: %s" %
                 (config_data['routine'], config_data['mode'],
                  config_data['bluetooth_enabled']))
-            return True
+        return True
 
-        except (OSError, RuntimeError) as e:
-            print("[CONFIG] ❌ Failed to save config: %s" % str(e))
-            return False
\ No newline at end of file
+    except (OSError, RuntimeError) as e:
+        print("[CONFIG] ❌ Failed to save config: %s" % str(e))
+        return False
\ No newline at end of file
@@ -9,7 +9,7 @@ The routine supports two roles:
     - **Follower**: Mirrors leader's display in real-time (Modes 2-4)
 
 Protocol Format:
-    ILLO_<seq>_<pos1>_<int1>_<col1>_<pos2>_<int2>_<col2>_<pos3>_<int3>_<col3>
+    ILLO_<SS><PIIC><PIIC><PIIC>  (14 fixed-width hex digits after the prefix)
 
 Example:
     >>> from dance_party import DanceParty
@@ -34,6 +34,7 @@ Note:
 from base_routine import BaseRoutine
 import time
 import gc
+import array
 from adafruit_circuitplayground import cp
 from adafruit_ble import BLERadio
 from adafruit_ble.advertising.standard import Advertisement
@@ -46,6 +47,29 @@ try:
 except Exception:
     _HAS_AUDIO = False
 
+# Secondary-channel scale tables for _themed_rgb, built once at import:
+# _SCALE_xx[i] == int(i * 0.xx) for intensities 0-255 (256 bytes each)
+_SCALE_05 = bytes(int(i * 0.05) for i in range(256))
+_SCALE_15 = bytes(int(i * 0.15) for i in range(256))
+_SCALE_30 = bytes(int(i * 0.30) for i in range(256))
+_SCALE_100 = bytes(range(256))
+
+# Per-color-type (r, g, b) scale tables: 0=red, 1=green, 2=blue/pink.
+# Indexing by ctype replaces the if/elif cascade with three lookups
+_CTYPE_SCALES = (
+    (_SCALE_100, _SCALE_15, _SCALE_15),
+    (_SCALE_15, _SCALE_100, _SCALE_15),
+    (_SCALE_30, _SCALE_05, _SCALE_100),
+)
+
+_TWO_PI = 6.283185307179586
+
+# Characters allowed in an advertisement name payload (lowercase hex only)
+_HEX_DIGITS = "0123456789abcdef"
+
+# Free-heap level (bytes) below which run() forces a collection
+_GC_THRESHOLD = 4096
+
 
 class DanceParty(BaseRoutine):
     """Leader/follower visual synchronization over BLE advertisement names.
@@ -70,16 +94,22 @@ class DanceParty(BaseRoutine):
         sync_enabled (bool): Whether BLE sync is enabled via config
         sync_active (bool): Whether BLE is currently initialized and active
         ble (BLERadio): BLE radio instance (None if not initialized)
+        _adv_period_ms (int): Active advertisement period (starts at `_ADV_PERIOD_MS`)
+        _scan_burst_s (float): Active follower scan burst, kept longer than `_adv_period_ms`
+        _smooth_alpha (float): Active follower alpha cap (starts at `_SMOOTH_ALPHA`)
 
     Class Attributes:
         _NUM_PIXELS (int): Number of NeoPixels on the device (10)
         _BRIGHTNESS (float): Global brightness setting (0.0-1.0)
         _STEP_MS (int): Time between position updates in milliseconds
         _ADV_PERIOD_MS (int): BLE advertisement refresh rate in milliseconds
-        _SCAN_BURST_S (float): Follower scan duration in seconds
+        _SCAN_BURST_S (float): Minimum follower scan duration in seconds
         _LOSS_TIMEOUT_S (float): Follower timeout before declaring leader lost
         _MIN_RENDER_MS (int): Minimum time between render updates (rate limiting)
-        _SMOOTH_ALPHA (float): Exponential smoothing factor for follower (0.0-1.0)
+        _SMOOTH_ALPHA (float): Follower smoothing factor for fast changes (0.0-1.0)
+        _EURO_MIN_CUTOFF (float): Follower smoothing cutoff for slow drifts (Hz)
+        _EURO_BETA (float): Cutoff increase per intensity unit/second of change
+        _EURO_D_CUTOFF (float): Cutoff for the follower's change-speed estimate (Hz)
 
 
     Example:
@@ -134,9 +164,17 @@ class DanceParty(BaseRoutine):
     # ADVANCED TIMING CONSTANTS (usually don't need to change these)
     # ============================================================================
     _STEP_MS = 260  # visual step timing (≈3.8 revs/min)
-    _SCAN_BURST_S = 0.20  # follower scan burst duration
+    _SCAN_BURST_S = 0.10  # minimum follower scan burst (see _set_adv_period)
     _LOSS_TIMEOUT_S = 3.0  # follower loss detection timeout
     _MIN_RENDER_MS = 15  # ~66 FPS render rate limit
+    _MIN_RENDER_NS = _MIN_RENDER_MS * 1000000
+
+    # Follower One-Euro smoothing: slow drifts are filtered at the minimum
+    # cutoff, fast changes (beats) raise it so they pass through almost
+    # unfiltered. _SMOOTH_ALPHA caps the per-frame response either way.
+    _EURO_MIN_CUTOFF = 1.0  # Hz
+    _EURO_BETA = 0.007
+    _EURO_D_CUTOFF = 1.0  # Hz
 
     def __init__(self, device_name, debug_bluetooth=False, debug_audio=False):
         """Initialize Dance Party routine.
@@ -160,6 +198,11 @@ class DanceParty(BaseRoutine):
         self.debug_bluetooth = bool(debug_bluetooth)
         self.debug_audio = bool(debug_audio)
 
+        # Tunables changed at runtime by set_responsiveness(); the class
+        # constants above are only their starting values
+        self._set_adv_period(self._ADV_PERIOD_MS)
+        self._smooth_alpha = self._SMOOTH_ALPHA
+
         # Validate timing configuration
         if self._STEP_MS < 100 or self._STEP_MS > 1000:
             print("[DANCE] ⚠️ _STEP_MS out of recommended range (100-1000ms)")
@@ -178,6 +221,8 @@ class DanceParty(BaseRoutine):
         # BLE
         self.ble = None
         self.sync_active = False
+        # One advertisement reused for every broadcast; only its name changes
+        self._adv = Advertisement()
         self.sync_manager = None  # checked by code.py
 
         # Leader state
@@ -197,10 +242,16 @@ class DanceParty(BaseRoutine):
         self._beat_on = False
         self._beat_timer = 0  # frames remaining for "pop"
         self._spark_pos = None  # transient spark position (uses third triple)
+        self._last_triples = [(0, 0, 0), (0, 0, 0), (0, 0, 0)]  # top 3 for BLE sync
 
         # Follower state
         self._last_seen_t = None
         self._last_seq = None
+        self._scan_gen = None  # open scan window, resumed across ticks
+        # Reused _parse_name result - slots are overwritten on every packet
+        self._parsed_triples = [(0, 0, 0), (0, 0, 0), (0, 0, 0)]
+        self._parsed = {"seq": 0, "triples": self._parsed_triples}
+        self._parsed_name = None  # name currently decoded into _parsed
 
         # Connection health tracking
         self._sync_success_count = 0
@@ -210,6 +261,11 @@ class DanceParty(BaseRoutine):
         # Role tracking
         self._role_announced = False
         self._current_role = None
+        # Per-frame handler picked by _select_run_impl for the current mode
+        # and BLE state, so run() doesn't re-branch every call
+        self._run_impl = None
+        self._run_mode = None
+        self._run_synced = False
 
         # Audio
         self._audio_ok = False
@@ -230,8 +286,25 @@ class DanceParty(BaseRoutine):
         cp.pixels.auto_write = False
         cp.pixels.brightness = self._BRIGHTNESS
         self._clear_pixels()
-        self._last_render_ms = 0
-        self._smooth_rgb = [[0.0, 0.0, 0.0] for _ in range(self._NUM_PIXELS)]
+        self._last_render_ns = 0
+        # Smoothed/persisted RGB levels as three flat float arrays, one per
+        # channel, so the per-pixel loops index storage instead of unpacking
+        # and rebuilding small lists. The leader's persistence and the
+        # follower's smoothing share these, updated in place; after a role
+        # switch the new role simply starts from the levels left behind
+        self._smooth_r = array.array('f', [0.0] * self._NUM_PIXELS)
+        self._smooth_g = array.array('f', [0.0] * self._NUM_PIXELS)
+        self._smooth_b = array.array('f', [0.0] * self._NUM_PIXELS)
+        self._smooth_speed = [0.0] * self._NUM_PIXELS  # follower change rate per pixel
+        self._pixel_data = bytearray(self._NUM_PIXELS)  # leader per-pixel intensities
+        # Flat RGB frame, written to the ring with one slice assignment
+        self._frame = bytearray(3 * self._NUM_PIXELS)
+        self._target = bytearray(3 * self._NUM_PIXELS)  # follower target colors
+        # Last follower frame pushed to the ring; only trusted while
+        # _shown_valid, since other handlers draw to the pixels too
+        self._shown_frame = bytearray(3 * self._NUM_PIXELS)
+        self._shown_valid = False
+        self._idle_frames, self._idle_triples = self._build_idle_frames()
 
         print("[DANCE] 🎵 Dance Party init — BLE=%s, audio=%s"
               % ("EN" if self.sync_enabled else "DIS",
@@ -298,8 +371,8 @@ class DanceParty(BaseRoutine):
             return False
 
         adv_period, smooth_alpha = presets[mode.lower()]
-        self._ADV_PERIOD_MS = adv_period
-        self._SMOOTH_ALPHA = smooth_alpha
+        self._set_adv_period(adv_period)
+        self._smooth_alpha = smooth_alpha
 
         print("[DANCE] 🎛️ Responsiveness set to '%s' (ads:%dms, alpha:%.2f)" % 
               (mode.upper(), adv_period, smooth_alpha))
@@ -327,13 +400,23 @@ class DanceParty(BaseRoutine):
             print("[DANCE] ⚠️ smooth_alpha must be 0.5-0.95")
             return False
 
-        self._ADV_PERIOD_MS = int(adv_period_ms)
-        self._SMOOTH_ALPHA = float(smooth_alpha)
+        self._set_adv_period(int(adv_period_ms))
+        self._smooth_alpha = float(smooth_alpha)
 
         print("[DANCE] 🎛️ Custom responsiveness (ads:%dms, alpha:%.2f)" % 
-              (self._ADV_PERIOD_MS, self._SMOOTH_ALPHA))
+              (self._adv_period_ms, self._smooth_alpha))
         return True
 
+    def _set_adv_period(self, adv_period_ms):
+        """Set the advertisement period and the follower scan burst with it.
+
+        A burst shorter than the leader's period can end between two
+        advertisements, so it is stretched to 1.25 periods when the
+        period is long enough (smooth preset, custom periods up to 200 ms).
+        """
+        self._adv_period_ms = adv_period_ms
+        self._scan_burst_s = max(self._SCAN_BURST_S, 1.25 * adv_period_ms / 1000)
+
     def run(self, mode, volume):
 
         """Main execution loop for Dance Party routine.
@@ -356,6 +439,22 @@ class DanceParty(BaseRoutine):
             >>> while True:
             ...     dance.run(mode=1, volume=1)  # Leader with audio (sound enabled)
         """
+        # Re-pick the frame handler only when the mode or BLE state changes
+        if mode != self._run_mode or self.sync_active != self._run_synced:
+            self._select_run_impl(mode)
+        self._run_impl()
+
+        # The frame paths barely allocate now, so only collect when the heap
+        # is actually tight instead of on a fixed frame count
+        if gc.mem_free() < _GC_THRESHOLD:
+            gc.collect()
+
+    def _select_run_impl(self, mode):
+        """Announce the role for a mode and bind the matching frame handler.
+
+        Args:
+            mode (int): 1=Leader, 2-4=Follower
+        """
         # Determine leader/follower based on mode
         is_leader = (mode == 1)
 
@@ -367,29 +466,42 @@ class DanceParty(BaseRoutine):
             self._role_announced = True
             self._current_role = is_leader
 
-        # Reinitialize BLE if mode changed and not yet active
-        if self.sync_enabled and not self.sync_active:
-            self._initialize_ble(is_leader)
+        # A follower scan window left open must not outlive the follower role
+        if self._scan_gen is not None:
+            self._stop_follower_scan()
 
+        # BLE that is enabled but down is retried only by _run_local, so a
+        # frame never initializes the radio twice
         if not self.sync_active:
-            # Local fallback: still show audio baton if possible
-            self._leader_frame()
-            self._advance_ring_if_due()
-            return
-
-        if is_leader:
-            # Draw first, then handle BLE (keeps visuals smooth)
-            self._leader_frame()
-            self._advance_ring_if_due()
-            self._leader_advertise_if_due()
+            self._run_impl = self._run_local
+        elif is_leader:
+            self._run_impl = self._run_leader
         else:
-            self._follower_loop()
-
-        # Periodic GC under debug
-        if self.debug_bluetooth and (self._seq % 50 == 0):
-            gc.collect()
-
-        time.sleep(0.001)
+            self._run_impl = self._follower_loop
+        self._run_mode = mode
+        self._run_synced = self.sync_active
+        self._shown_valid = False
+
+    def _run_leader(self):
+        """Leader frame: draw first, then handle BLE (keeps visuals smooth)."""
+        self._leader_frame()
+        self._advance_ring_if_due()
+        self._leader_advertise_if_due()
+
+    def _run_local(self):
+        """Local fallback frame: still show the audio baton while BLE is down.
+
+        Retries BLE init each frame when sync is enabled - the only per-frame
+        init site - for the role chosen by _select_run_impl; once it comes
+        up, run() sees the new state and switches to the leader/follower
+        handler.
+        """
+        if self.sync_enabled:
+            self._initialize_ble(self._current_role)
+            if self.sync_active:
+                return
+        self._leader_frame()
+        self._advance_ring_if_due()
 
     def _leader_frame(self):
         """Render audio-reactive visualization with frequency-based rotation and persistence.
@@ -433,27 +545,48 @@ class DanceParty(BaseRoutine):
             if self.debug_audio and (self._seq % 50 == 0):
                 print("[DANCE] 🎵 Freq: %.1f Hz" % freq)
 
-            # Map deltas to pixel intensities
-            pixel_data = [0] * self._NUM_PIXELS
-            for i in range(min(len(deltas), self._NUM_PIXELS)):
-                # Scale deltas to intensity range
-                intensity = min(255, int(abs(deltas[i]) * 2.5))
-                pixel_data[i] = intensity
+            # Hot-path locals - avoid repeated self./cp. lookups per pixel
+            num_pixels = self._NUM_PIXELS
+            pixels = cp.pixels
+            themed_rgb = self._themed_rgb
+
+            # Map deltas to pixel intensities (reused buffer, inline abs/clamp)
+            pixel_data = self._pixel_data
+            count = len(deltas)
+            for i in range(num_pixels):
+                if i < count:
+                    d = deltas[i]
+                    intensity = int((-d if d < 0 else d) * 2.5)
+                    pixel_data[i] = intensity if intensity < 256 else 255
+                else:
+                    pixel_data[i] = 0
 
             # Apply rotation based on frequency
             current_time = time.monotonic()
             time_delta = current_time - self.last_update
             rotation_increment = freq * time_delta * 0.01
-            self.rotation_offset = (self.rotation_offset + rotation_increment) % self._NUM_PIXELS
+            rotation_offset = (self.rotation_offset + rotation_increment) % num_pixels
+            self.rotation_offset = rotation_offset
             self.last_update = current_time
 
-            # Clear and render with rotation
-            self._clear_pixels()
-
-            # Apply rotation and render pixels
-            active_pixels = []
-            for i in range(self._NUM_PIXELS):
-                rotated_index = int((i + self.rotation_offset) % self._NUM_PIXELS)
+            # Persistence: every pixel decays 25% per frame, and new audio
+            # peaks raise it back up. Kept in the _smooth_* arrays so there's
+            # no readback from the driver and no blocking sleep between shows
+            smooth_r = self._smooth_r
+            smooth_g = self._smooth_g
+            smooth_b = self._smooth_b
+            for i in range(num_pixels):
+                smooth_r[i] *= 0.75
+            for i in range(num_pixels):
+                smooth_g[i] *= 0.75
+            for i in range(num_pixels):
+                smooth_b[i] *= 0.75
+
+            # Apply rotation and render pixels, keeping the 3 brightest for BLE
+            # sync in a single pass (strict > keeps the earlier pixel on ties)
+            top1 = top2 = top3 = None
+            for i in range(num_pixels):
+                rotated_index = int((i + rotation_offset) % num_pixels)
                 base_intensity = pixel_data[i]
 
                 if base_intensity > 50:  # Threshold for visibility
@@ -465,28 +598,38 @@ class DanceParty(BaseRoutine):
                     else:
                         color_type = 2  # Blue/pink for lower
 
-                    rgb = self._themed_rgb(base_intensity, color_type)
-                    cp.pixels[rotated_index] = rgb
-                    active_pixels.append((rotated_index, base_intensity, color_type))
-
-            cp.pixels.show()
-
-            # Fade effect for persistence
-            time.sleep(0.03)
-            for i in range(self._NUM_PIXELS):
-                current_color = cp.pixels[i]
-                if current_color != (0, 0, 0):
-                    faded_color = tuple(int(c * 0.75) for c in current_color)
-                    cp.pixels[i] = faded_color
+                    r, g, b = themed_rgb(base_intensity, color_type)
+                    if r > smooth_r[rotated_index]:
+                        smooth_r[rotated_index] = r
+                    if g > smooth_g[rotated_index]:
+                        smooth_g[rotated_index] = g
+                    if b > smooth_b[rotated_index]:
+                        smooth_b[rotated_index] = b
+
+                    if top1 is None or base_intensity > top1[1]:
+                        top3 = top2
+                        top2 = top1
+                        top1 = (rotated_index, base_intensity, color_type)
+                    elif top2 is None or base_intensity > top2[1]:
+                        top3 = top2
+                        top2 = (rotated_index, base_intensity, color_type)
+                    elif top3 is None or base_intensity > top3[1]:
+                        top3 = (rotated_index, base_intensity, color_type)
+
+            # Fill the flat frame and push it in one slice assignment rather
+            # than a tuple and a setitem per pixel
+            frame = self._frame
+            j = 0
+            for i in range(num_pixels):
+                frame[j] = int(smooth_r[i])
+                frame[j + 1] = int(smooth_g[i])
+                frame[j + 2] = int(smooth_b[i])
+                j += 3
+            pixels[0:num_pixels] = frame
+            pixels.show()
 
             # Cache top 3 brightest pixels for BLE sync
-            active_pixels.sort(key=lambda x: x[1], reverse=True)
-            self._last_triples = []
-            for i in range(3):
-                if i < len(active_pixels):
-                    self._last_triples.append(active_pixels[i])
-                else:
-                    self._last_triples.append((0, 0, 2))
+            self._last_triples = [top1 or (0, 0, 2), top2 or (0, 0, 2), top3 or (0, 0, 2)]
 
         except Exception as e:
             if self.debug_audio:
@@ -498,28 +641,41 @@ class DanceParty(BaseRoutine):
         current_time = time.monotonic()
 
         if current_time - self.last_update > 0.15:
-            self.rotation_offset = (self.rotation_offset + 1) % self._NUM_PIXELS
-
-            self._clear_pixels()
+            num_pixels = self._NUM_PIXELS
+            self.rotation_offset = (self.rotation_offset + 1) % num_pixels
 
-            # Create rotating comet effect
+            # Rotating comet: the frame for each head position is prebuilt
             main_pos = int(self.rotation_offset)
-            trail1_pos = (main_pos - 1) % self._NUM_PIXELS
-            trail2_pos = (main_pos - 2) % self._NUM_PIXELS
-
-            cp.pixels[main_pos] = self._themed_rgb(120, 2)
-            cp.pixels[trail1_pos] = self._themed_rgb(80, 2)
-            cp.pixels[trail2_pos] = self._themed_rgb(50, 2)
-
+            cp.pixels[0:num_pixels] = self._idle_frames[main_pos]
             cp.pixels.show()
             self.last_update = current_time
 
             # Cache for BLE sync
-            self._last_triples = [
-                (main_pos, 120, 2),
-                (trail1_pos, 80, 2),
-                (trail2_pos, 50, 2),
+            self._last_triples = self._idle_triples[main_pos]
+
+    def _build_idle_frames(self):
+        """Precompute the idle comet for every head position.
+
+        Returns:
+            tuple: (frames, triples) - indexed by head position, a flat RGB
+                frame and the matching list of 3 BLE triples
+        """
+        num_pixels = self._NUM_PIXELS
+        frames = []
+        triples = []
+        for head in range(num_pixels):
+            state = [
+                (head, 120, 2),
+                ((head - 1) % num_pixels, 80, 2),
+                ((head - 2) % num_pixels, 50, 2),
             ]
+            frame = bytearray(3 * num_pixels)
+            for (pos, inten, ctype) in state:
+                j = 3 * pos
+                frame[j:j + 3] = bytes(self._themed_rgb(inten, ctype))
+            frames.append(bytes(frame))
+            triples.append(state)
+        return tuple(frames), tuple(triples)
 
     def _themed_rgb(self, inten, ctype):
         """Convert intensity and color type to RGB tuple.
@@ -534,12 +690,10 @@ class DanceParty(BaseRoutine):
         inten = int(inten)
         if inten <= 0:
             return (0, 0, 0)
-        if ctype == 0:  # red-ish
-            return (inten, int(inten * 0.15), int(inten * 0.15))
-        elif ctype == 1:  # green-ish
-            return (int(inten * 0.15), inten, int(inten * 0.15))
-        else:  # blue/pink-ish
-            return (int(inten * 0.3), int(inten * 0.05), inten)
+        if inten > 255:
+            inten = 255
+        r_scale, g_scale, b_scale = _CTYPE_SCALES[ctype]
+        return (r_scale[inten], g_scale[inten], b_scale[inten])
 
     def _advance_ring_if_due(self):
         """Advance the ring position based on timing and swing effects.
@@ -568,19 +722,19 @@ class DanceParty(BaseRoutine):
             MemoryError: Triggers emergency GC and reports memory status
 
         Note:
-            - Rate-limited by `_ADV_PERIOD_MS` (faster for visualizer sync)
+            - Rate-limited by `_adv_period_ms` (faster for visualizer sync)
             - MUST stop and restart advertising to broadcast new name
             - Errors are suppressed except MemoryError (always reported)
         """
         t = self._now_ms()
-        if (t - self._last_adv_ms) < self._ADV_PERIOD_MS:
+        if (t - self._last_adv_ms) < self._adv_period_ms:
             return
 
         name = self._build_adv_name_from_triples()
 
         try:
-            # Create fresh advertisement with new name
-            adv = Advertisement()
+            # Reuse the cached advertisement; only the name changes
+            adv = self._adv
             adv.complete_name = name
 
             # MUST stop advertising before starting with new name
@@ -613,29 +767,36 @@ class DanceParty(BaseRoutine):
             str: Advertisement name in ILLO protocol format
 
         Format:
-            ILLO_<seq>_<p1>_<i1>_<c1>_<p2>_<i2>_<c2>_<p3>_<i3>_<c3>
+            ILLO_<SS><PIIC><PIIC><PIIC>
+
+        Where (all fixed-width lowercase hex):
+            - SS: Sequence number (2 digits, 0-255, wraps)
+            - P: Pixel position (1 digit, 0-9)
+            - II: Intensity (2 digits, 0-255)
+            - C: Color type (1 digit, 0=red, 1=green, 2=blue)
 
-        Where:
-            - seq: Sequence number (0-255, wraps)
-            - p: Pixel position (0-9)
-            - i: Intensity (0-255)
-            - c: Color type (0=red, 1=green, 2=blue)
+        The name is always 19 characters, which fits the advertising packet
+        alongside the flags field. The old decimal form could reach 32
+        characters and be truncated.
+
+        Not compatible with the old decimal ``ILLO_<seq>_<p1>_<i1>_...``
+        format: every device in a Dance Party must run the same firmware
+        version, or followers ignore the leader.
 
         Note:
-            - Pads with zeros if fewer than 3 triples cached
+            - ``_last_triples`` always holds exactly 3 triples (set in __init__
+              and by every frame), so no padding is needed here
             - Increments sequence number on each call
         """
-        triples = getattr(self, "_last_triples", [])
-        while len(triples) < 3:
-            triples.append((0, 0, 0))
-        self._seq = (self._seq + 1) % 256
-        (p1, i1, c1) = triples[0]
-        (p2, i2, c2) = triples[1]
-        (p3, i3, c3) = triples[2]
-        name = "ILLO_%d_%d_%d_%d_%d_%d_%d_%d_%d_%d" % (
-            self._seq, p1, i1, c1, p2, i2, c2, p3, i3, c3
+        (p1, i1, c1), (p2, i2, c2), (p3, i3, c3) = self._last_triples
+        seq = (self._seq + 1) % 256
+        self._seq = seq
+        # One % format builds the name in a single pass; a join over str()
+        # pieces would allocate eleven intermediate strings instead
+        name = "ILLO_%02x%x%02x%x%x%02x%x%x%02x%x" % (
+            seq, p1, i1, c1, p2, i2, c2, p3, i3, c3
         )
-        if self.debug_bluetooth and (self._seq % 20 == 0):
+        if self.debug_bluetooth and (seq % 20 == 0):
             print("[DANCE] 📡 ADV: %s" % name)
         return name
 
@@ -656,60 +817,84 @@ class DanceParty(BaseRoutine):
         Note:
             - Processes packets immediately for minimal latency
             - Shorter scan bursts allow more frequent updates
+            - A scan window left open by an early exit is resumed on the next call
             - Clears display after `_LOSS_TIMEOUT_S` without leader packets
         """
         found = False
         packets_processed = 0
-
-        # Active scan with reduced timeout for faster cycling
-        for adv in self.ble.start_scan(
-                Advertisement, timeout=self._SCAN_BURST_S, minimum_rssi=-90, active=True
-        ):
-            adv_name = ""
+        ble = self.ble
+        debug = self.debug_bluetooth
+
+        # The scan window stays open across follower ticks: after a frame
+        # renders, the next tick resumes the same scan and drains whatever
+        # the radio buffered meanwhile, instead of a stop/start per tick.
+        # A fresh window starts only once the current one runs out.
+        rendered = False
+        while not rendered:
+            scan = self._scan_gen
+            fresh = scan is None
+            if fresh:
+                scan = ble.start_scan(
+                    Advertisement, timeout=self._scan_burst_s, minimum_rssi=-90, active=True
+                )
+                self._scan_gen = scan
             try:
-                if getattr(adv, "complete_name", None):
-                    adv_name = adv.complete_name
-                elif getattr(adv, "short_name", None):
-                    adv_name = adv.short_name
+                for adv in scan:
+                    adv_name = ""
+                    try:
+                        if getattr(adv, "complete_name", None):
+                            adv_name = adv.complete_name
+                        elif getattr(adv, "short_name", None):
+                            adv_name = adv.short_name
+                    except Exception:
+                        adv_name = ""
+
+                    if not adv_name or not adv_name.startswith("ILLO_"):
+                        continue
+
+                    # Debug: show what we're receiving
+                    if debug and packets_processed == 0:
+                        print("[DANCE] 🔍 Received: %s" % adv_name)
+
+                    parsed = self._parse_name(adv_name)
+                    if not parsed:
+                        self._sync_fail_count += 1
+                        if debug:
+                            print("[DANCE] ⚠️ Parse failed for: %s" % adv_name)
+                        continue
+
+                    found = True
+                    self._sync_success_count += 1
+                    self._last_seen_t = time.monotonic()
+                    packets_processed += 1
+
+                    # Render all new frames immediately (no sequence filtering)
+                    # This reduces latency at the cost of potential duplicate renders
+                    if self._last_seq is None or parsed["seq"] != self._last_seq:
+                        self._last_seq = parsed["seq"]
+                        self._render_triples(parsed["triples"])
+
+                        if debug and (self._last_seq % 20 == 0):
+                            print("[DANCE] 🔗 Rendered seq=%d, triples=%s" % (self._last_seq, parsed["triples"]))
+
+                        # Exit immediately after rendering for minimal latency
+                        rendered = True
+                        break
             except Exception:
-                adv_name = ""
-
-            if not adv_name or not adv_name.startswith("ILLO_"):
-                continue
-
-            # Debug: show what we're receiving
-            if self.debug_bluetooth and packets_processed == 0:
-                print("[DANCE] 🔍 Received: %s" % adv_name)
-
-            parsed = self._parse_name(adv_name)
-            if not parsed:
-                self._sync_fail_count += 1
-                if self.debug_bluetooth:
-                    print("[DANCE] ⚠️ Parse failed for: %s" % adv_name)
-                continue
-
-            found = True
-            self._sync_success_count += 1
-            self._last_seen_t = time.monotonic()
-            packets_processed += 1
-
-            # Render all new frames immediately (no sequence filtering)
-            # This reduces latency at the cost of potential duplicate renders
-            if self._last_seq is None or parsed["seq"] != self._last_seq:
-                self._last_seq = parsed["seq"]
-                self._render_triples(parsed["triples"])
-
-                if self.debug_bluetooth and (self._last_seq % 20 == 0):
-                    print("[DANCE] 🔗 Rendered seq=%d, triples=%s" % (self._last_seq, parsed["triples"]))
-
-                # Exit immediately after rendering for minimal latency
+                # Never leave the radio scanning after an error
+                self._stop_follower_scan()
+                raise
+            if rendered:
+                break
+            # Window ended with no new frame; if it was carried over from an
+            # earlier tick, give this tick one fresh window before giving up
+            self._stop_follower_scan()
+            if fresh:
                 break
-
-        self.ble.stop_scan()
 
         # Periodic health report (every 30 seconds)
         now = time.monotonic()
-        if self.debug_bluetooth and (now - self._last_health_report_t) >= 30.0:
+        if debug and (now - self._last_health_report_t) >= 30.0:
             total = self._sync_success_count + self._sync_fail_count
             if total > 0:
                 success_rate = (self._sync_success_count * 100) // total
@@ -720,14 +905,22 @@ class DanceParty(BaseRoutine):
 
         # Loss handling
         if not found and self._last_seen_t is not None:
-            if (time.monotonic() - self._last_seen_t) >= self._LOSS_TIMEOUT_S:
-                if self.debug_bluetooth:
+            if (now - self._last_seen_t) >= self._LOSS_TIMEOUT_S:
+                if debug:
                     print("[DANCE] ❌ leader lost — clearing")
                 self._clear_pixels()
+                self._shown_valid = False
                 self._last_seq = None
+                # Restart scanning from a clean window
+                self._stop_follower_scan()
 
-        # Minimal sleep to avoid busy-waiting but keep responsive
-        time.sleep(0.001)
+    def _stop_follower_scan(self):
+        """Stop the follower's open scan window, if any."""
+        self._scan_gen = None
+        try:
+            self.ble.stop_scan()
+        except Exception:
+            pass  # May not be scanning
 
     def _parse_name(self, name):
         """Parse BLE advertisement name into visual state.
@@ -737,33 +930,50 @@ class DanceParty(BaseRoutine):
 
         Returns:
             dict or None: Dictionary with keys 'seq' (int) and 'triples' (list of tuples),
-                or None if parsing failed or format invalid
+                or None if parsing failed or format invalid. The same dict and
+                list are reused for every packet, so use them before the next call.
 
         Format:
-            ILLO_seq_p1_i1_c1_p2_i2_c2_p3_i3_c3
+            ILLO_<SS><PIIC><PIIC><PIIC> (see _build_adv_name_from_triples)
 
         Note:
             - Validates all values are within acceptable ranges
             - Replaces invalid triples with (0,0,0)
-            - Returns None if name format is incorrect
+            - Returns None if name format is incorrect, including names in
+              the old decimal ``ILLO_<seq>_<p1>_...`` format
         """
+        # Each advertisement repeats on three channels, so an active scan
+        # usually sees the same name back to back; reuse the last decode
+        if name == self._parsed_name:
+            return self._parsed
         try:
-            parts = name.split("_")
-            if len(parts) != 11:
+            if len(name) != 19:
                 return None
-            seq = int(parts[1])
-            vals = [int(x) for x in parts[2:11]]
-            triples = [(vals[0], vals[1], vals[2]),
-                       (vals[3], vals[4], vals[5]),
-                       (vals[6], vals[7], vals[8])]
-            # Sanity clamp
-            clean = []
-            for (p, i, c) in triples:
-                if 0 <= p < self._NUM_PIXELS and 0 <= i <= 255 and 0 <= c <= 2:
-                    clean.append((p, i, c))
+            # int(x, 16) also takes '_' separators, a sign and whitespace, so
+            # check the payload is all protocol hex digits before parsing
+            payload = name[5:]
+            for ch in payload:
+                if ch not in _HEX_DIGITS:
+                    return None
+            # The fields are nibble-aligned, so one hex parse of the whole
+            # payload replaces ten int() calls; fields are then masked out
+            v = int(payload, 16)
+            num_pixels = self._NUM_PIXELS
+            triples = self._parsed_triples
+            for k in (2, 1, 0):
+                c = v & 0xF
+                i = (v >> 4) & 0xFF
+                p = (v >> 12) & 0xF
+                v >>= 16
+                # Sanity clamp
+                if p < num_pixels and c <= 2:
+                    triples[k] = (p, i, c)
                 else:
-                    clean.append((0, 0, 0))
-            return {"seq": seq, "triples": clean}
+                    triples[k] = (0, 0, 0)
+            parsed = self._parsed
+            parsed["seq"] = v & 0xFF
+            self._parsed_name = name
+            return parsed
         except Exception:
             return None
 
@@ -771,68 +981,101 @@ class DanceParty(BaseRoutine):
         """Render received visual state to NeoPixels with minimal latency.
 
         Args:
-            triples (list): List of (position, intensity, color_type) tuples
+            triples (list): List of (position, intensity, color_type) tuples,
+                already range-checked by `_parse_name`
 
         Note:
             - Reduced rate limiting for faster updates (optimized for visualizer)
-            - Higher smoothing alpha for snappier response with minimal lag
+            - One-Euro smoothing: each pixel's alpha follows how fast it is
+              changing, capped at `_smooth_alpha`
             - Maps color types to RGB: 0=red, 1=green, 2=blue/pink
             - Clamps all output values to valid NeoPixel range (0-255)
+            - Skips `show()` when the frame matches the one already shown
         """
-        # Reduced rate-limit for faster render updates
-        now = self._now_ms()
-        if (now - self._last_render_ms) < self._MIN_RENDER_MS:
+        # Reduced rate-limit for faster render updates. monotonic_ns() is an
+        # exact int, where monotonic() is a 30-bit float that drifts to
+        # coarser than 15 ms steps after a few hours of uptime
+        now = time.monotonic_ns()
+        last_render_ns = self._last_render_ns
+        if (now - last_render_ns) < self._MIN_RENDER_NS:
             return
 
-        # Build target RGB for all 10 pixels from the 3 triples
-        target = [[0, 0, 0] for _ in range(self._NUM_PIXELS)]
-        for (pos, inten, ctype) in triples:
-            pos = int(pos)
-            inten = int(inten)
-            ctype = int(ctype)
+        # Hot-path locals - attribute/global lookups bound once per frame
+        num_pixels = self._NUM_PIXELS
+        ctype_scales = _CTYPE_SCALES
 
-            if inten <= 0 or not (0 <= pos < self._NUM_PIXELS):
+        # Build target RGB for all 10 pixels from the 3 triples, in a reused
+        # flat buffer; colors come from the same scale tables as _themed_rgb
+        target = self._target
+        for j in range(3 * num_pixels):
+            target[j] = 0
+        for (pos, inten, ctype) in triples:
+            if inten <= 0:
                 continue
-
-            # Map ILLO color types to RGB (optimized)
-            if ctype == 0:  # red-ish
-                r = inten
-                g = int(inten * 0.15)
-                b = int(inten * 0.15)
-                if r == 0 and inten > 0:
-                    r = 1
-            elif ctype == 1:  # green-ish
-                r = int(inten * 0.15)
-                g = inten
-                b = int(inten * 0.15)
-            else:  # blue/pink-ish
-                r = int(inten * 0.30)
-                g = int(inten * 0.05)
-                b = inten
-
-            target[pos] = [r, g, b]
-
-        # Faster exponential smoothing (higher alpha = less latency)
-        a = self._SMOOTH_ALPHA
-        for i in range(self._NUM_PIXELS):
-            sr, sg, sb = self._smooth_rgb[i]
-            tr, tg, tb = target[i]
-
-            # Apply smoothing with optimized response
-            sr = sr + (tr - sr) * a
-            sg = sg + (tg - sg) * a
-            sb = sb + (tb - sb) * a
-
-            self._smooth_rgb[i] = [sr, sg, sb]
+            j = 3 * pos
+            r_scale, g_scale, b_scale = ctype_scales[ctype]
+            target[j] = r_scale[inten]
+            target[j + 1] = g_scale[inten]
+            target[j + 2] = b_scale[inten]
+
+        # One-Euro filter: alpha = k*fc / (1 + k*fc) with k = 2*pi*dt, where
+        # the cutoff fc rises with the pixel's smoothed rate of change
+        dt = (now - last_render_ns) / 1000000000.0
+        k = _TWO_PI * dt
+        kd = k * self._EURO_D_CUTOFF
+        a_d = kd / (1.0 + kd)
+        inv_dt = 1.0 / dt
+        a_max = self._smooth_alpha
+        min_cutoff = self._EURO_MIN_CUTOFF
+        beta = self._EURO_BETA
+        frame = self._frame
+        speed = self._smooth_speed
+        j = 0
+        smooth_r = self._smooth_r
+        smooth_g = self._smooth_g
+        smooth_b = self._smooth_b
+        for i in range(num_pixels):
+            sr = smooth_r[i]
+            sg = smooth_g[i]
+            sb = smooth_b[i]
+            dr = target[j] - sr
+            dg = target[j + 1] - sg
+            db = target[j + 2] - sb
+
+            # Largest channel change, in intensity units per second
+            d = max(abs(dr), abs(dg), abs(db)) * inv_dt
+            v = speed[i] + (d - speed[i]) * a_d
+            speed[i] = v
+            kc = k * (min_cutoff + beta * v)
+            a = kc / (1.0 + kc)
+            if a > a_max:
+                a = a_max
+
+            sr = sr + dr * a
+            sg = sg + dg * a
+            sb = sb + db * a
+            smooth_r[i] = sr
+            smooth_g[i] = sg
+            smooth_b[i] = sb
 
             # Fast cast + clamp for NeoPixel
-            r = 0 if sr < 0 else (255 if sr > 255 else int(sr + 0.5))
-            g = 0 if sg < 0 else (255 if sg > 255 else int(sg + 0.5))
-            b = 0 if sb < 0 else (255 if sb > 255 else int(sb + 0.5))
-            cp.pixels[i] = (r, g, b)
+            frame[j] = 0 if sr < 0 else (255 if sr > 255 else int(sr + 0.5))
+            frame[j + 1] = 0 if sg < 0 else (255 if sg > 255 else int(sg + 0.5))
+            frame[j + 2] = 0 if sb < 0 else (255 if sb > 255 else int(sb + 0.5))
+            j += 3
 
-        cp.pixels.show()
-        self._last_render_ms = now
+        self._last_render_ns = now
+
+        # Settled or quiet frames often round to exactly what the ring
+        # already shows; skip the slice write and the NeoPixel transfer
+        shown = self._shown_frame
+        if self._shown_valid and frame == shown:
+            return
+        pixels = cp.pixels
+        pixels[0:num_pixels] = frame
+        pixels.show()
+        shown[:] = frame
+        self._shown_valid = True
 
     def _initialize_ble(self, is_leader=False):
         """Initialize BLE radio for leader or follower mode.
@@ -852,9 +1095,8 @@ class DanceParty(BaseRoutine):
 
             if is_leader:
                 try:
-                    name = "ILLO_0_0_0_0_0_0_0_0_0_0"
-                    adv = Advertisement()
-                    adv.complete_name = name
+                    adv = self._adv
+                    adv.complete_name = "ILLO_00000000000000"
                     try:
                         self.ble.stop_advertising()
                     except Exception:
@@ -883,7 +1125,7 @@ class DanceParty(BaseRoutine):
         Returns:
             int: Current time in milliseconds since boot
         """
-        return int(time.monotonic() * 1000)
+        return time.monotonic_ns() // 1000000
 
     def get_debug_status(self):
         """Return current status for debugging and monitoring.
@@ -918,17 +1160,17 @@ class DanceParty(BaseRoutine):
 
     @staticmethod
     def _load_dance_config():
-        """Load configuration from ConfigManager or return defaults.
+        """Load configuration from config_manager or return defaults.
 
         Returns:
             dict: Configuration dictionary with at least 'bluetooth_enabled' key
 
         Note:
-            Falls back to default config if ConfigManager unavailable
+            Falls back to default config if config_manager unavailable
         """
         try:
-            from config_manager import ConfigManager
-            return ConfigManager().load_config()
+            from config_manager import load_config
+            return load_config()
         except Exception:
             return {'bluetooth_enabled': True}
 
@@ -943,16 +1185,15 @@ class DanceParty(BaseRoutine):
             - Catches and logs all exceptions during cleanup
             - Always attempts to clear pixels even if BLE cleanup fails
         """
+        # The ring is cleared below, so the next follower frame must be shown
+        self._shown_valid = False
         try:
             if self.ble:
                 try:
                     self.ble.stop_advertising()
                 except Exception:
                     pass
-                try:
-                    self.ble.stop_scan()
-                except Exception:
-                    pass
+                self._stop_follower_scan()
 
             self._clear_pixels()
 
@@ -15,6 +15,9 @@ The hardware manager handles:
 Classes:
     HardwareManager: Hardware abstraction for Circuit Playground
 
+Functions:
+    get_hardware_manager: Shared HardwareManager used by every routine
+
 Example:
     >>> hardware = HardwareManager()
     >>> hardware.update_pixels_with_data(data, color_function)
@@ -25,25 +28,56 @@ Author:
 
 Dependencies:
     - adafruit_circuitplayground
-    - simpleio
 """
 
 from adafruit_circuitplayground import cp
-import simpleio
 import time
 
+# The one HardwareManager, created on first use and kept across routine switches
+_shared_hardware = None
+
+
+def get_hardware_manager():
+    """Return the shared HardwareManager, restoring the default brightness.
+
+    Routines come and go on every switch, but the pixels do not; sharing
+    one manager keeps its caches and skips redundant brightness writes.
+    """
+    global _shared_hardware
+    if _shared_hardware is None:
+        _shared_hardware = HardwareManager()
+    else:
+        _shared_hardware.reset_brightness()
+    return _shared_hardware
+
+
 class HardwareManager:
     def __init__(self):
         self.pixels = cp.pixels
         self.base_brightness = 0.1  # Default brightness for battery conservation
         self.pixels.brightness = self.base_brightness
+        # Delta index -> pixel bucket tables, keyed by len(deltas)
+        self._bucket_cache = {}
+        # Result buffer reused by map_deltas_to_pixels
+        self._pixel_data_buf = [0] * 10
         
     def update_pixels_with_data(self, pixel_data, color_func):
-        """Update pixels based on data array and color function."""
-        for ii in range(10):
-            self.pixels[ii] = color_func(pixel_data[ii])
+        """Update pixels based on data array and color function.
+
+        Colors are gathered first and written with one slice assignment,
+        so the driver copies its buffer once instead of per pixel.
+        """
+        self.pixels[0:10] = [color_func(pixel_data[ii]) for ii in range(10)]
         self.pixels.show()
         
+    def reset_brightness(self):
+        """Restore the default brightness, skipping the write if already set.
+
+        Changing brightness makes the driver rescale its whole buffer.
+        """
+        if self.pixels.brightness != self.base_brightness:
+            self.pixels.brightness = self.base_brightness
+
     def clear_pixels(self):
         """Clear all pixels."""
         self.pixels.fill(0)
@@ -54,13 +88,31 @@ class HardwareManager:
         if volume == 1:
             cp.play_tone(freq, duration, 1)
 
-    @staticmethod
-    def map_deltas_to_pixels(deltas):
-        """Map audio deltas to pixel positions."""
-        pixel_data = [0] * 10
-        for ii, delta in enumerate(deltas):
-            ix = round(simpleio.map_range(ii, 0, len(deltas), 0, 9))
-            pixel_data[ix] += delta
+    def map_deltas_to_pixels(self, deltas):
+        """Map audio deltas to pixel positions.
+
+        Each delta goes to the pixel ``round(simpleio.map_range(ii, 0, n, 0, 9))``
+        picks; that table is cached per delta count, which is why this is an
+        instance method rather than a staticmethod.
+
+        Returns:
+            list: Ten summed deltas. The same list is returned and rewritten
+                by every call, so callers must not keep it across calls - copy
+                it if needed. ufo_ai_behaviors and intergalactic_cruising only
+                read it within the frame that produced it.
+        """
+        n = len(deltas)
+        buckets = self._bucket_cache.get(n)
+        if buckets is None:
+            # Same mapping as simpleio.map_range(ii, 0, n, 0, 9); ii < n
+            # keeps it inside 0-9, so no clamping is needed
+            buckets = tuple(round(ii * 9 / n) for ii in range(n))
+            self._bucket_cache[n] = buckets
+        pixel_data = self._pixel_data_buf
+        for ii in range(10):
+            pixel_data[ii] = 0
+        for ii in range(n):
+            pixel_data[buckets[ii]] += deltas[ii]
         return pixel_data
 
     @staticmethod
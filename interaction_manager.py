@@ -6,6 +6,10 @@ from adafruit_circuitplayground import cp
 from physical_actions import PhysicalActions
 from light_manager import LightManager
 
+# Shared result for the common "nothing happened" case, so idle loops
+# don't allocate a fresh tuple
+_NO_INTERACTIONS = (False, False, False)
+
 
 class InteractionManager:
     def __init__(self, enable_debug=False):
@@ -17,11 +21,11 @@ class InteractionManager:
         """
         self.enable_debug = enable_debug
         
-        # Interaction debouncing
-        self.last_tap_time = 0
-        self.last_shake_time = 0
-        self.tap_debounce_delay = 0.5  # 500ms between taps
-        self.shake_debounce_delay = 1.0  # 1 second between shakes
+        # Interaction debouncing (integer milliseconds from monotonic_ns)
+        self.last_tap_ms = 0
+        self.last_shake_ms = 0
+        self.tap_debounce_ms = 500  # 500ms between taps
+        self.shake_debounce_ms = 1000  # 1 second between shakes
         
         # Light manager for light interactions (created when needed)
         self.light_manager = None
@@ -85,7 +89,7 @@ class InteractionManager:
                   (routine_number, preferences.get('tap', False), preferences.get('shake', False),
                    preferences.get('light_interactions', False), preferences.get('light_brightness', False)))
     
-    def check_interactions(self, routine_number, volume, pixels=None):
+    def check_interactions(self, routine_number, volume, pixels=None, actions=True):
         """
         Check for all relevant interactions for the current routine.
         
@@ -93,38 +97,39 @@ class InteractionManager:
             routine_number: Current active routine (1-4)
             volume: Current volume/sound setting
             pixels: NeoPixel object for brightness adjustment
+            actions: Run the tap/shake pixel actions; pass False while
+                something else (button feedback) owns the ring, so
+                interactions are still detected and debounced but not drawn
             
         Returns:
-            dict: Dictionary of detected interactions
+            tuple: (tap, shake, light_interaction) booleans
         """
-        interactions = {
-            'tap': False,
-            'shake': False,
-            'light_interaction': False,
-            'light_change': 0,
-            'current_light': 0,
-            'brightness_adjusted': False
-        }
+        tap = False
+        shake = False
+        light_interaction = False
         
         preferences = self.routine_interactions.get(routine_number, {})
-        current_time = time.monotonic()
         
         # Check tap interactions
         if preferences.get('tap', False) and cp.tapped:
-            if current_time - self.last_tap_time > self.tap_debounce_delay:
-                interactions['tap'] = True
-                self.last_tap_time = current_time
-                PhysicalActions.tapped(volume)
+            current_ms = time.monotonic_ns() // 1000000
+            if current_ms - self.last_tap_ms > self.tap_debounce_ms:
+                tap = True
+                self.last_tap_ms = current_ms
+                if actions:
+                    PhysicalActions.tapped(volume)
                 
                 if self.enable_debug:
                     print("[INTERACT] Tap detected for routine %d" % routine_number)
         
         # Check shake interactions
         if preferences.get('shake', False) and cp.shake(shake_threshold=11):
-            if current_time - self.last_shake_time > self.shake_debounce_delay:
-                interactions['shake'] = True
-                self.last_shake_time = current_time
-                PhysicalActions.shaken(volume)
+            current_ms = time.monotonic_ns() // 1000000
+            if current_ms - self.last_shake_ms > self.shake_debounce_ms:
+                shake = True
+                self.last_shake_ms = current_ms
+                if actions:
+                    PhysicalActions.shaken(volume)
                 
                 if self.enable_debug:
                     print("[INTERACT] Shake detected for routine %d" % routine_number)
@@ -133,22 +138,19 @@ class InteractionManager:
         if self.light_manager is not None:
             # Brightness adjustment (if enabled and pixels provided)
             if preferences.get('light_brightness', False) and pixels is not None:
-                current_light = self.light_manager.update_brightness_for_ambient_light(pixels)
-                interactions['current_light'] = current_light
-                interactions['brightness_adjusted'] = True
+                self.light_manager.update_brightness_for_ambient_light(pixels)
             
             # Light interaction detection (if enabled)
             if preferences.get('light_interactions', False):
-                light_detected, light_change, current_light = self.light_manager.check_light_interaction()
-                interactions['light_interaction'] = light_detected
-                interactions['light_change'] = light_change
-                interactions['current_light'] = current_light
+                light_interaction, light_change, _ = self.light_manager.check_light_interaction()
                 
-                if light_detected and self.enable_debug:
+                if light_interaction and self.enable_debug:
                     print("[INTERACT] Light interaction detected for routine %d (change: %.1f)" %
                           (routine_number, light_change))
         
-        return interactions
+        if tap or shake or light_interaction:
+            return tap, shake, light_interaction
+        return _NO_INTERACTIONS
     
     def get_light_manager(self):
         """Get the light manager instance (if available)."""
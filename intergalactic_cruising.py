@@ -37,9 +37,8 @@ class IntergalacticCruising(BaseRoutine):
     def _load_configuration(self):
         """Load configuration with proper error handling."""
         try:
-            from config_manager import ConfigManager
-            config_mgr = ConfigManager()
-            config = config_mgr.load_config()
+            from config_manager import load_config
+            config = load_config()
             device_name = config.get('name', 'UFO_CRUISER')
             bluetooth_config_enabled = config.get('bluetooth_enabled', True)
             return device_name, bluetooth_config_enabled
@@ -256,8 +255,9 @@ class IntergalacticCruising(BaseRoutine):
         for ii in range(10):
             current_color = self.hardware.pixels[ii]
             if current_color != (0, 0, 0):
-                faded_color = tuple(int(c * fade_factor) for c in current_color)
-                self.hardware.pixels[ii] = faded_color
+                r, g, b = current_color
+                self.hardware.pixels[ii] = (int(r * fade_factor), int(g * fade_factor),
+                                            int(b * fade_factor))
 
         self.last_update = current_time
 
@@ -367,8 +367,9 @@ class IntergalacticCruising(BaseRoutine):
             if color_override is not None:
                 # Use custom color for comet
                 main_color = color_override
-                trail1_color = tuple(int(c * 0.6) for c in color_override)
-                trail2_color = tuple(int(c * 0.3) for c in color_override)
+                r, g, b = color_override
+                trail1_color = (int(r * 0.6), int(g * 0.6), int(b * 0.6))
+                trail2_color = (int(r * 0.3), int(g * 0.3), int(b * 0.3))
             else:
                 # Use color function
                 main_color = color_func(120)
@@ -377,9 +378,13 @@ class IntergalacticCruising(BaseRoutine):
 
             # Apply brightness override if set
             if brightness_override is not None:
-                main_color = tuple(int(c * brightness_override) for c in main_color)
-                trail1_color = tuple(int(c * brightness_override) for c in trail1_color)
-                trail2_color = tuple(int(c * brightness_override) for c in trail2_color)
+                scale = brightness_override
+                r, g, b = main_color
+                main_color = (int(r * scale), int(g * scale), int(b * scale))
+                r, g, b = trail1_color
+                trail1_color = (int(r * scale), int(g * scale), int(b * scale))
+                r, g, b = trail2_color
+                trail2_color = (int(r * scale), int(g * scale), int(b * scale))
 
             self.hardware.pixels[main_pos] = main_color
             self.hardware.pixels[trail1_pos] = trail1_color
@@ -19,6 +19,7 @@ class LightManager:
         if self.enable_interactions:
             self.light_history = [0] * 5  # Track recent light readings for spike detection
             self.light_history_index = 0
+            self.light_history_count = 0  # Non-zero readings currently in light_history
             self.last_light_update = 0
             self.interaction_threshold = 50  # Light change threshold for interaction detection
             
@@ -87,29 +88,37 @@ class LightManager:
         Returns:
             (interaction_detected, light_change, current_light)
         """
+        # One sensor read per call, shared by every path below
+        current_light = cp.light
+
         if not self.enable_interactions:
-            return False, 0, cp.light
+            return False, 0, current_light
 
         current_time = time.monotonic()
 
         # Update light history every 0.1 seconds
         if current_time - self.last_light_update > 0.1:
-            current_light = cp.light
 
             # Initialize baseline on first reading
             if not self.baseline_initialized:
                 self.baseline_light = current_light
                 self.baseline_initialized = True
             
-            # Store in circular buffer for short-term history
-            self.light_history[self.light_history_index] = current_light
-            self.light_history_index = (self.light_history_index + 1) % len(
-                self.light_history)
+            # Store in circular buffer for short-term history, keeping the
+            # count of non-zero readings current as slots are overwritten
+            # (a covered sensor reads 0 and must not count as history)
+            index = self.light_history_index
+            if self.light_history[index] > 0:
+                self.light_history_count -= 1
+            if current_light > 0:
+                self.light_history_count += 1
+            self.light_history[index] = current_light
+            self.light_history_index = (index + 1) % len(self.light_history)
 
             self.last_light_update = current_time
 
             # Check for significant change from baseline
-            if len([x for x in self.light_history if x > 0]) >= 3:  # Have enough history
+            if self.light_history_count >= 3:  # Have enough history
                 # Compare current reading to adaptive baseline
                 light_change = abs(current_light - self.baseline_light)
 
@@ -124,7 +133,7 @@ class LightManager:
                 if interaction_detected:
                     return True, light_change, current_light
 
-        return False, 0, cp.light
+        return False, 0, current_light
 
     def get_current_light_level(self):
         """Get the current light sensor reading."""
@@ -135,4 +144,5 @@ class LightManager:
         if self.enable_interactions:
             self.light_history = [0] * 5
             self.light_history_index = 0
+            self.light_history_count = 0
             print("[LIGHT] Light interaction history reset")
@@ -7,6 +7,11 @@ from adafruit_circuitplayground import cp
 
 
 class Meditate(BaseRoutine):
+    # Expansion order outward from the center pair (4, 5), one entry per
+    # level: Box Breathing lights single pixels, the others symmetric rings
+    _BOX_EXPANSION = ((3,), (6,), (2,), (7,))
+    _RING_EXPANSION = ((3, 6), (2, 7), (1, 8), (0, 9))
+
     def __init__(self, adaptive_timing=None, ultra_dim=None):
         super().__init__()
 
@@ -18,22 +23,21 @@ class Meditate(BaseRoutine):
         # Store ultra_dim setting (not currently used but available for future brightness control)
         self.ultra_dim = ultra_dim if ultra_dim is not None else True
 
-        # Breathing pattern definitions
-        self.breath_patterns = {
-            1: {"name": "4-7-8 Breathing", "inhale": 4.0, "hold1": 7.0, "exhale": 8.0,
-                "hold2": 0},
-            2: {"name": "Box Breathing", "inhale": 4.0, "hold1": 4.0, "exhale": 4.0,
-                "hold2": 4.0},
-            3: {"name": "Triangle Breathing", "inhale": 4.0, "hold1": 4.0,
-                "exhale": 4.0, "hold2": 0},
-            4: {"name": "Deep Relaxation", "inhale": 6.0, "hold1": 2.0, "exhale": 8.0,
-                "hold2": 0}
-        }
+        # Breathing pattern definitions, indexed by mode 1-4:
+        # (name, inhale, hold1, exhale, hold2) with durations in seconds
+        self.breath_patterns = (
+            None,  # modes are 1-based
+            ("4-7-8 Breathing", 4.0, 7.0, 8.0, 0.0),
+            ("Box Breathing", 4.0, 4.0, 4.0, 4.0),
+            ("Triangle Breathing", 4.0, 4.0, 4.0, 0.0),
+            ("Deep Relaxation", 6.0, 2.0, 8.0, 0.0),
+        )
 
         self.start_time = time.monotonic()
         self.last_phase = None
-        self.last_update = 0
-        self.update_delay = 0.05  # Increased from 0.03 for better performance
+        # Frame pacing in integer nanoseconds (monotonic_ns avoids float math)
+        self.last_update_ns = 0
+        self.update_delay_ns = 50000000  # 50ms - increased from 30ms for better performance
 
         # Cache for smoother performance
         self.last_intensity = -1
@@ -43,6 +47,12 @@ class Meditate(BaseRoutine):
 
         # Track last pattern mode to detect changes
         self.last_pattern_mode = None
+        # Pattern mode of the frame currently on the pixels
+        self.last_display_mode = None
+
+        # Phase boundaries per (pattern_mode, timing_multiplier); the
+        # multiplier has only four values, so this stays tiny
+        self._phase_cache = {}
 
         print("[MEDITATE] 🧘 Enhanced Meditate initialized")
         print("[MEDITATE] Breathing pattern controlled by Button B (Mode 1-4)")
@@ -55,22 +65,21 @@ class Meditate(BaseRoutine):
     def _load_adaptive_timing():
         """Load adaptive timing preference from config."""
         try:
-            from config_manager import ConfigManager
-            config_mgr = ConfigManager()
-            config = config_mgr.load_config()
+            from config_manager import load_config
+            config = load_config()
             return config.get('meditate_adaptive_timing', True)
         except:
             return True  # Default enabled
 
     def run(self, mode, volume):
         """Run the enhanced 'meditate' routine - completely silent and non-reactive."""
-        current_time = time.monotonic()
+        current_ns = time.monotonic_ns()
 
         # Control update frequency for a smooth meditation experience
-        if current_time - self.last_update < self.update_delay:
+        if current_ns - self.last_update_ns < self.update_delay_ns:
             return
 
-        self.last_update = current_time
+        self.last_update_ns = current_ns
         color_func = self.get_color_function(mode)
 
         # Use mode value as the breathing pattern (1-4) to select breathing pattern
@@ -93,33 +102,48 @@ class Meditate(BaseRoutine):
         else:  # Normal indoor lighting
             return 1.0  # Standard timing
 
+    @staticmethod
+    def _phase_boundaries(pattern, timing_multiplier):
+        """Compute cycle length and phase ends (as cycle fractions) for a pattern.
+
+        Returns:
+            tuple: (total_cycle_time, inhale_end, hold1_end, exhale_end);
+                hold2 is the remainder of the cycle
+        """
+        _, inhale, hold1, exhale, hold2 = pattern
+
+        # Calculate total cycle time with adaptive timing
+        total_cycle_time = (inhale + hold1 + exhale + hold2) * timing_multiplier
+
+        # Calculate phase boundaries
+        inhale_duration = inhale * timing_multiplier
+        hold1_duration = hold1 * timing_multiplier
+        exhale_duration = exhale * timing_multiplier
+
+        inhale_end = inhale_duration / total_cycle_time
+        hold1_end = (inhale_duration + hold1_duration) / total_cycle_time
+        exhale_end = (
+                             inhale_duration + hold1_duration + exhale_duration) / total_cycle_time
+        return total_cycle_time, inhale_end, hold1_end, exhale_end
+
     def _breathing_pattern(self, color_func, pattern_mode):
         """Enhanced breathing pattern with multiple techniques."""
         current_time = time.monotonic()
 
         # Use pattern_mode (which is mode 1-4) to select a breathing pattern
-        pattern = self.breath_patterns[pattern_mode]
         timing_multiplier = self._calculate_adaptive_timing()
 
-        # Calculate total cycle time with adaptive timing
-        total_cycle_time = (pattern["inhale"] + pattern["hold1"] +
-                            pattern["exhale"] + pattern["hold2"]) * timing_multiplier
+        key = (pattern_mode, timing_multiplier)
+        phases = self._phase_cache.get(key)
+        if phases is None:
+            phases = self._phase_boundaries(self.breath_patterns[pattern_mode], timing_multiplier)
+            self._phase_cache[key] = phases
+        total_cycle_time, inhale_end, hold1_end, exhale_end = phases
 
         # Calculate cycle position (0 to 1)
         cycle_position = ((
                                   current_time - self.start_time) % total_cycle_time) / total_cycle_time
 
-        # Calculate phase boundaries
-        inhale_duration = pattern["inhale"] * timing_multiplier
-        hold1_duration = pattern["hold1"] * timing_multiplier
-        exhale_duration = pattern["exhale"] * timing_multiplier
-
-        inhale_end = inhale_duration / total_cycle_time
-        hold1_end = (inhale_duration + hold1_duration) / total_cycle_time
-        exhale_end = (
-                             inhale_duration + hold1_duration + exhale_duration) / total_cycle_time
-        # hold2 is the remainder
-
         # Determine current phase and intensity
         if cycle_position < inhale_end:
             # Inhale phase - gradual increase from 0 to 255
@@ -146,79 +170,87 @@ class Meditate(BaseRoutine):
             current_phase = "hold2"
             intensity = 30
 
+        # Skip no-op frames before any drawing: the phase is unchanged (so
+        # nothing would print either) and intensity moved too little to see
+        if (abs(intensity - self.last_intensity) < 5 and current_phase == self.last_phase
+                and pattern_mode == self.last_display_mode):
+            return
+
         # Update display with pattern-specific visualization
-        self._update_meditation_display(color_func, intensity, current_phase, pattern)
+        self._update_meditation_display(color_func, intensity, current_phase, pattern_mode)
 
         # Print breathing pattern at start of each breath cycle or when a pattern changes
         if current_phase != self.last_phase:
             if current_phase == "inhale" or pattern_mode != self.last_pattern_mode:
-                print("[MEDITATE] 🫁 %s" % pattern["name"])
+                print("[MEDITATE] 🫁 %s" % self.breath_patterns[pattern_mode][0])
                 self.last_pattern_mode = pattern_mode
             self.last_phase = current_phase
 
-    def _update_meditation_display(self, color_func, intensity, phase, pattern):
-        """Enhanced meditation display with pattern-specific visuals - optimized for performance."""
-        # Only update if intensity changed significantly (reduces flicker and improves performance)
-        if abs(intensity - self.last_intensity) < 5 and phase == self.last_phase:
-            return
+    def _update_meditation_display(self, color_func, intensity, phase, pattern_mode):
+        """Enhanced meditation display with pattern-specific visuals - optimized for performance.
 
+        _breathing_pattern() has already skipped frames whose intensity
+        changed too little to see (reduces flicker and improves performance).
+        """
         self.last_intensity = intensity
+        self.last_display_mode = pattern_mode
+
+        pixels = self.hardware.pixels
 
         # Set ultra-low brightness once instead of every update
-        if self.hardware.pixels.brightness != 0.05:
-            self.hardware.pixels.brightness = 0.05
+        if pixels.brightness != 0.05:
+            pixels.brightness = 0.05
 
         # Clear pixels directly on hardware
         self.hardware.clear_pixels()
 
         if phase == "inhale":
-            self._show_expansion_pattern(color_func, intensity, pattern)
+            self._show_expansion_pattern(color_func, intensity, pattern_mode)
         elif phase in ["hold1", "hold2"]:
             self._show_hold_pattern(color_func, intensity, phase)
         else:  # exhale
             # Use the same expansion pattern as inhale for a smooth reverse effect
-            self._show_expansion_pattern(color_func, intensity, pattern)
+            self._show_expansion_pattern(color_func, intensity, pattern_mode)
 
         # Show the pixels
-        self.hardware.pixels.show()
+        pixels.show()
 
-    def _show_expansion_pattern(self, color_func, intensity, pattern):
+    def _show_expansion_pattern(self, color_func, intensity, pattern_mode):
         """Show expansion during inhale - pattern specific."""
         expansion_level = (intensity / 255.0) * 5
 
-        # Center-focused expansion for all patterns
-        center_pixels = [4, 5]  # Always start here
-        for pos in center_pixels:
-            self.hardware.pixels[pos] = color_func(intensity)
-
-        # Pattern-specific expansion styles
-        if pattern["name"] == "Box Breathing":
-            # Square expansion pattern
-            if expansion_level > 1:
-                square_pixels = [3, 6, 2, 7]
-                for i, pos in enumerate(square_pixels):
-                    if expansion_level > i + 1:
-                        fade_intensity = int(
-                            intensity * min(1.0, expansion_level - i - 1))
-                        self.hardware.pixels[pos] = color_func(fade_intensity)
+        # Center-focused expansion for all patterns (always start at 4 and 5);
+        # color_func is pure, so each distinct color is computed once
+        pixels = self.hardware.pixels
+        full_color = color_func(intensity)
+        pixels[4] = full_color
+        pixels[5] = full_color
+
+        # Pattern-specific expansion styles: square for Box Breathing,
+        # circular for the others
+        if pattern_mode == 2:  # Box Breathing
+            expansion = self._BOX_EXPANSION
         else:
-            # Circular expansion for other patterns
-            expansion_rings = [[3, 6], [2, 7], [1, 8], [0, 9]]
-            for i, ring in enumerate(expansion_rings):
-                if expansion_level > i + 1:
-                    for pos in ring:
-                        fade_intensity = int(
-                            intensity * min(1.0, expansion_level - i - 1))
-                        self.hardware.pixels[pos] = color_func(fade_intensity)
+            expansion = self._RING_EXPANSION
+        for i, ring in enumerate(expansion):
+            delta = expansion_level - i - 1
+            if delta <= 0:
+                break  # Levels fill outward, so no later ring is lit either
+            if delta >= 1:
+                color = full_color  # Inner ring, same color as the center
+            else:
+                color = color_func(int(intensity * delta))  # Fading edge ring
+            for pos in ring:
+                pixels[pos] = color
 
     def _show_hold_pattern(self, color_func, intensity, phase):
         """Show a steady pattern during hold phases."""
+        pixels = self.hardware.pixels
+        color = color_func(intensity)
         if phase == "hold2":
             # Second hold - very minimal presence
-            center_pixels = [4, 5]
-            for pos in center_pixels:
-                self.hardware.pixels[pos] = color_func(intensity)
+            pixels[4] = color
+            pixels[5] = color
         else:
-            # First hold - full steady presence
-            for i in range(10):
-                self.hardware.pixels[i] = color_func(intensity)
+            # First hold - full steady presence, one C-level fill
+            pixels.fill(color)
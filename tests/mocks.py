@@ -37,6 +37,8 @@ class MockBoard:
     A0 = MockPin("A0")
     A1 = MockPin("A1")
     LED = MockPin("LED")
+    BUTTON_A = MockPin("BUTTON_A")
+    BUTTON_B = MockPin("BUTTON_B")
 
 
 # Mock digitalio module
@@ -47,7 +49,22 @@ class MockDigitalIO:
         def __init__(self, pin):
             self.pin = pin
             self.direction = None
-            self.value = False
+            self.pull = None
+            self.deinited = False
+            self._value = False
+
+        @property
+        def value(self):
+            # Like CircuitPython, a released pin can no longer be read
+            if self.deinited:
+                raise ValueError("Object has been deinitialized")
+            return self._value
+
+        @value.setter
+        def value(self, value):
+            if self.deinited:
+                raise ValueError("Object has been deinitialized")
+            self._value = value
 
         def switch_to_output(self, value=False):
             self.direction = "output"
@@ -55,9 +72,10 @@ class MockDigitalIO:
 
         def switch_to_input(self, pull=None):
             self.direction = "input"
+            self.pull = pull
 
         def deinit(self):
-            pass
+            self.deinited = True
 
     class Direction:
         INPUT = "input"
@@ -120,6 +138,130 @@ class MockAudioBusIO:
             self.playing = False
 
 
+# Mock NeoPixel ring
+class MockPixels:
+    """Mock for the cp.pixels NeoPixel ring, recording every shown frame"""
+
+    def __init__(self, count=10):
+        self.count = count
+        self.buf = bytearray(3 * count)
+        self.brightness = 1.0
+        self.shown = []  # Copy of the flat RGB buffer at each show()
+
+    def _set(self, index, color):
+        if isinstance(color, int):
+            color = ((color >> 16) & 0xFF, (color >> 8) & 0xFF, color & 0xFF)
+        self.buf[3 * index:3 * index + 3] = bytes(color)
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            start, stop, _ = index.indices(self.count)
+            value = list(value)
+            if value and isinstance(value[0], int) and len(value) == 3 * (stop - start):
+                # Flat RGB bytes, as written by the slice-assignment paths
+                self.buf[3 * start:3 * stop] = bytes(value)
+            else:
+                for offset, color in enumerate(value):
+                    self._set(start + offset, color)
+        else:
+            self._set(index, value)
+
+    def __getitem__(self, index):
+        return tuple(self.buf[3 * index:3 * index + 3])
+
+    def fill(self, color):
+        for i in range(self.count):
+            self._set(i, color)
+
+    def show(self):
+        self.shown.append(bytes(self.buf))
+
+
+# Mock adafruit_circuitplayground module
+class MockCircuitPlayground:
+    """Mock for the adafruit_circuitplayground module (exposes ``cp``)"""
+
+    class CP:
+        def __init__(self):
+            self.pixels = MockPixels()
+            self.switch = False
+            self.light = 0
+            self.temperature = 25.0
+            self.acceleration = (0.0, 0.0, 9.8)
+            self.tapped = False
+            self.detect_taps = 1
+            self.shaking = False
+            self.tones = []
+            # Buttons are pulled-down inputs, as on the Bluefruit
+            self._a = MockDigitalIO.DigitalInOut(MockBoard.BUTTON_A)
+            self._a.switch_to_input(pull=MockDigitalIO.Pull.DOWN)
+            self._b = MockDigitalIO.DigitalInOut(MockBoard.BUTTON_B)
+            self._b.switch_to_input(pull=MockDigitalIO.Pull.DOWN)
+
+        @property
+        def button_a(self):
+            return self._a.value
+
+        @property
+        def button_b(self):
+            return self._b.value
+
+        def shake(self, shake_threshold=30):
+            return self.shaking
+
+        def play_tone(self, frequency, duration, volume=1):
+            self.tones.append((frequency, duration))
+
+    cp = CP()
+
+
+# Mock microcontroller module
+class MockMicrocontroller:
+    """Mock for CircuitPython microcontroller module"""
+
+    reset_count = 0
+
+    @classmethod
+    def reset(cls):
+        cls.reset_count += 1
+
+
+# Mock adafruit_ble modules
+class MockBLE:
+    """Mock for adafruit_ble (BLERadio) and adafruit_ble.advertising.standard"""
+
+    class Advertisement:
+        def __init__(self):
+            self.complete_name = None
+            self.short_name = None
+
+    class BLERadio:
+        created = 0  # Radios constructed, across all instances
+
+        def __init__(self):
+            MockBLE.BLERadio.created += 1
+            self.advertising = False
+            self.advertised = []  # Names passed to start_advertising()
+            self.scan_results = []  # Advertisements yielded by start_scan()
+            self.scanning = False
+
+        def start_advertising(self, advertisement):
+            self.advertising = True
+            self.advertised.append(advertisement.complete_name)
+
+        def stop_advertising(self):
+            self.advertising = False
+
+        def start_scan(self, *advertisement_types, timeout=None, minimum_rssi=-80,
+                       active=True):
+            self.scanning = True
+            self.scan_timeout = timeout
+            return iter(list(self.scan_results))
+
+        def stop_scan(self):
+            self.scanning = False
+
+
 # Function to inject mocks
 def inject_mocks():
     """Inject mock modules into sys.modules for testing"""
@@ -138,6 +280,19 @@ def inject_mocks():
     sys.modules['storage'] = MockStorage()
     sys.modules['audiocore'] = MockAudioCore()
     sys.modules['audiobusio'] = MockAudioBusIO()
+    sys.modules['adafruit_circuitplayground'] = MockCircuitPlayground()
+    sys.modules['microcontroller'] = MockMicrocontroller()
+
+    ble_module = ModuleType('adafruit_ble')
+    ble_module.BLERadio = MockBLE.BLERadio
+    advertising_module = ModuleType('adafruit_ble.advertising')
+    standard_module = ModuleType('adafruit_ble.advertising.standard')
+    standard_module.Advertisement = MockBLE.Advertisement
+    advertising_module.standard = standard_module
+    ble_module.advertising = advertising_module
+    sys.modules['adafruit_ble'] = ble_module
+    sys.modules['adafruit_ble.advertising'] = advertising_module
+    sys.modules['adafruit_ble.advertising.standard'] = standard_module
 
 
 # Check if we're running on CircuitPython or need mocks
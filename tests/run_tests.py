@@ -22,8 +22,17 @@ else:
 
 # Import test cases
 from tests.test_memory_manager import TestMemoryManager
-from tests.test_config_manager import TestConfigManager
+from tests.test_config_manager import TestConfigManager, TestConfigFiles
 from tests.test_audio_processor import TestAudioProcessor
+from tests.test_main_loop import (TestTaskScheduler, TestConfigSavePacing,
+                                   TestFeedbackAnimator, TestButtonFeedbackFrames,
+                                   TestButtonKeys)
+from tests.test_light_manager import TestLightManager
+from tests.test_interaction_manager import TestInteractionManager
+from tests.test_college_manager import TestCollegeManager
+from tests.test_hardware_manager import TestHardwareManager
+from tests.test_dance_party import (TestDancePartyProtocol, TestDancePartyDispatch,
+                                     TestDancePartyRender)
 
 
 def main():
@@ -39,7 +48,20 @@ def main():
     test_cases = [
         TestMemoryManager,
         TestConfigManager,
+        TestConfigFiles,
         TestAudioProcessor,
+        TestTaskScheduler,
+        TestConfigSavePacing,
+        TestFeedbackAnimator,
+        TestButtonFeedbackFrames,
+        TestButtonKeys,
+        TestLightManager,
+        TestInteractionManager,
+        TestCollegeManager,
+        TestHardwareManager,
+        TestDancePartyProtocol,
+        TestDancePartyDispatch,
+        TestDancePartyRender,
     ]
 
     # Run all tests
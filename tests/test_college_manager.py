@@ -0,0 +1,49 @@
+"""
+Unit tests for CollegeManager
+Tests the defaults returned when no college is loaded
+"""
+import sys
+import os
+import operator
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from tests.test_framework import TestCase
+from tests.mocks import setup_test_environment
+
+# Setup mocks if needed
+setup_test_environment()
+
+from college_manager import CollegeManager
+
+
+class TestCollegeManager(TestCase):
+    """Test cases for CollegeManager defaults"""
+
+    def setUp(self):
+        """Setup test fixtures"""
+        self.manager = CollegeManager("none")
+
+    def tearDown(self):
+        """Clean up after tests"""
+        self.manager = None
+
+    def test_default_colors_not_shared(self):
+        """Test changing returned colors does not leak into other managers"""
+        colors = self.manager.get_colors()
+        colors["primary"] = (0, 0, 0)
+        other = CollegeManager("none").get_colors()
+        self.assert_equal(other["primary"], (255, 255, 255))
+        self.assert_equal(self.manager.get_colors()["primary"], (255, 255, 255))
+
+    def test_default_tone_immutable(self):
+        """Test the default response tone cannot be modified in place"""
+        tone = self.manager.get_response_tone()
+        self.assert_equal(tuple(tone), (200, 0.3))
+        self.assert_raises(TypeError, operator.setitem, tone, 0, 1000)
+
+
+if __name__ == '__main__':
+    test = TestCollegeManager()
+    test.run_all_tests()
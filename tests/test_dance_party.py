@@ -0,0 +1,335 @@
+"""
+Unit tests for DanceParty
+Tests the BLE advertisement name protocol shared by leader and followers
+"""
+import sys
+import os
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from tests.test_framework import TestCase
+from tests.mocks import setup_test_environment
+
+# Setup mocks if needed
+setup_test_environment()
+
+import dance_party
+from dance_party import DanceParty
+
+
+class TestDancePartyProtocol(TestCase):
+    """Test cases for building and parsing ILLO advertisement names"""
+
+    def setUp(self):
+        """Setup test fixtures"""
+        self.dance = DanceParty("ILLO")
+
+    def tearDown(self):
+        """Clean up after tests"""
+        self.dance.cleanup()
+        self.dance = None
+
+    def _round_trip(self, triples):
+        self.dance._last_triples = triples
+        name = self.dance._build_adv_name_from_triples()
+        parsed = self.dance._parse_name(name)
+        self.assert_not_none(parsed, "Should parse its own name: %s" % name)
+        return name, parsed
+
+    def test_name_is_fixed_width(self):
+        """Test every name is 19 characters of prefix plus lowercase hex"""
+        for triples in ([(0, 0, 0)] * 3, [(9, 255, 2), (9, 255, 2), (9, 255, 2)]):
+            self.dance._last_triples = triples
+            name = self.dance._build_adv_name_from_triples()
+            self.assert_equal(len(name), 19, "Bad length: %s" % name)
+            self.assert_true(name.startswith("ILLO_"))
+            self.assert_true(all(ch in "0123456789abcdef" for ch in name[5:]))
+
+    def test_round_trip(self):
+        """Test triples and sequence survive build -> parse"""
+        cases = (
+            [(0, 0, 0), (0, 0, 0), (0, 0, 0)],
+            [(5, 180, 1), (4, 120, 1), (3, 80, 2)],
+            [(9, 255, 2), (0, 1, 0), (7, 16, 1)],
+        )
+        for triples in cases:
+            seq = (self.dance._seq + 1) % 256
+            name, parsed = self._round_trip(list(triples))
+            self.assert_equal(parsed["triples"], list(triples), "Triples for %s" % name)
+            self.assert_equal(parsed["seq"], seq, "Sequence for %s" % name)
+
+    def test_sequence_wraps(self):
+        """Test the sequence number wraps from 255 to 0"""
+        self.dance._seq = 254
+        _, parsed = self._round_trip([(1, 2, 0)] * 3)
+        self.assert_equal(parsed["seq"], 255)
+        _, parsed = self._round_trip([(1, 2, 0)] * 3)
+        self.assert_equal(parsed["seq"], 0)
+
+    def test_documented_example(self):
+        """Test the example name from the Bluetooth guide"""
+        parsed = self.dance._parse_name("ILLO_2a5b4147813502")
+        self.assert_equal(parsed["seq"], 42)
+        self.assert_equal(parsed["triples"], [(5, 180, 1), (4, 120, 1), (3, 80, 2)])
+
+    def test_rejects_malformed_names(self):
+        """Test names int(x, 16) would accept but the protocol does not"""
+        bad_names = (
+            "ILLO_2a5b414781350",       # Too short
+            "ILLO_2a5b41478135020",     # Too long
+            "ILLO_2a5b4147813g02",      # Not hex
+            "ILLO_2a5b_147813502",      # Underscore separator
+            "ILLO_+a5b4147813502",      # Sign
+            "ILLO_-a5b4147813502",
+            "ILLO_ 2a5b414781350",      # Whitespace
+            "ILLO_2a5b414781350 ",
+            "ILLO_2A5B4147813502",      # Uppercase hex
+            "ILLO_42_5_180_1_4_120_1",  # Old decimal format
+            "",
+        )
+        for name in bad_names:
+            self.assert_equal(self.dance._parse_name(name), None, "Should reject %r" % name)
+
+    def test_out_of_range_triples_zeroed(self):
+        """Test a bad pixel or color type only blanks that triple"""
+        # Pixel a (10) is off the ring, color type 3 is unknown
+        parsed = self.dance._parse_name("ILLO_01a05012003ff3")
+        self.assert_equal(parsed["triples"], [(0, 0, 0), (1, 32, 0), (0, 0, 0)])
+
+    def test_rejected_name_does_not_clobber_last_parse(self):
+        """Test a bad packet leaves the previous decode intact"""
+        self.dance._parse_name("ILLO_2a5b4147813502")
+        self.assert_equal(self.dance._parse_name("ILLO_2a5b_147813502"), None)
+        parsed = self.dance._parse_name("ILLO_2a5b4147813502")
+        self.assert_equal(parsed["triples"], [(5, 180, 1), (4, 120, 1), (3, 80, 2)])
+
+
+class FailingRadio:
+    """BLERadio stand-in that always fails, counting init attempts"""
+
+    attempts = 0
+
+    def __init__(self):
+        FailingRadio.attempts += 1
+        raise RuntimeError("radio unavailable")
+
+
+class TestDancePartyDispatch(TestCase):
+    """Test cases for per-frame handler dispatch"""
+
+    def setUp(self):
+        """Setup test fixtures"""
+        self._real_radio = dance_party.BLERadio
+        dance_party.BLERadio = FailingRadio
+        self.dance = DanceParty("ILLO")
+        FailingRadio.attempts = 0
+
+    def tearDown(self):
+        """Clean up after tests"""
+        dance_party.BLERadio = self._real_radio
+        self.dance.cleanup()
+        self.dance = None
+
+    def test_first_frame_inits_ble_once(self):
+        """Test a frame with BLE down retries radio setup only once"""
+        self.dance.run(2, 0)
+        self.assert_equal(FailingRadio.attempts, 1, "One init attempt per frame")
+        self.dance.run(2, 0)
+        self.assert_equal(FailingRadio.attempts, 2)
+
+    def test_mode_change_inits_ble_once(self):
+        """Test a role change with BLE down still retries only once"""
+        self.dance.run(2, 0)
+        FailingRadio.attempts = 0
+        self.dance.run(1, 0)
+        self.assert_equal(FailingRadio.attempts, 1)
+
+    def test_ble_recovery_switches_handler(self):
+        """Test the frame after a successful retry runs the role's handler"""
+        self.dance.run(2, 0)
+        dance_party.BLERadio = self._real_radio
+        self.dance.run(2, 0)
+        self.assert_true(self.dance.sync_active, "Retry should bring BLE up")
+        self.dance.run(2, 0)
+        self.assert_equal(self.dance._run_impl, self.dance._follower_loop)
+
+    def test_scan_burst_outlasts_adv_period(self):
+        """Test every follower scan window covers at least one leader period"""
+        self.dance.ble = self._real_radio()
+        for mode in ("fast", "balanced", "smooth"):
+            self.dance.set_responsiveness(mode)
+            self.dance._follower_loop()
+            timeout = self.dance.ble.scan_timeout
+            self.assert_true(timeout >= self.dance._SCAN_BURST_S, "%s: %r" % (mode, timeout))
+            self.assert_true(timeout * 1000 > self.dance._adv_period_ms, "%s: %r" % (mode, timeout))
+        self.dance.set_custom_responsiveness(200, 0.9)
+        self.dance._follower_loop()
+        self.assert_true(self.dance.ble.scan_timeout * 1000 > 200)
+
+
+class FakeAudio:
+    """AudioProcessor stand-in that replays queued delta lists at 0 Hz"""
+
+    def __init__(self):
+        self.deltas = []
+
+    def record_samples(self):
+        return [0]
+
+    def compute_deltas(self, samples):
+        return self.deltas.pop(0)
+
+    def calculate_frequency(self, deltas):
+        return 0.0  # No rotation, so pixel i renders at position i
+
+
+class FakeTime:
+    """Stand-in for dance_party.time with a hand-advanced clock"""
+
+    def __init__(self):
+        self.ns = 0
+
+    def monotonic_ns(self):
+        return self.ns
+
+    def monotonic(self):
+        return self.ns / 1000000000.0
+
+    def sleep(self, seconds):
+        self.ns += int(seconds * 1000000000)
+
+
+class TestDancePartyRender(TestCase):
+    """Test cases for leader and follower frame rendering"""
+
+    def setUp(self):
+        """Setup test fixtures"""
+        self.dance = DanceParty("ILLO")
+        self.pixels = dance_party.cp.pixels
+        self._real_time = dance_party.time
+        self.clock = FakeTime()
+        dance_party.time = self.clock
+
+    def tearDown(self):
+        """Clean up after tests"""
+        dance_party.time = self._real_time
+        self.dance.cleanup()
+        self.dance = None
+
+    def _render_at(self, ms, triples):
+        self.clock.ns = ms * 1000000
+        self.dance._render_triples(triples)
+
+    def _pixel(self, i):
+        frame = self.dance._frame
+        return (frame[3 * i], frame[3 * i + 1], frame[3 * i + 2])
+
+    def test_leader_peak_decays(self):
+        """Test a one-frame peak persists and fades over the following frames"""
+        audio = FakeAudio()
+        audio.deltas = [[0, 0, 0, 0, 100]] + [[0] * 5] * 20
+        self.dance.audio = audio
+        self.dance._audio_ok = True
+
+        self.dance._leader_frame()
+        peak = max(self._pixel(4))
+        self.assert_true(peak > 0, "Peak should light pixel 4")
+        previous = peak
+        for _ in range(3):
+            self.dance._leader_frame()
+            level = max(self._pixel(4))
+            self.assert_true(0 < level < previous, "Expected decay, got %d" % level)
+            previous = level
+        for _ in range(17):
+            self.dance._leader_frame()
+        self.assert_equal(self._pixel(4), (0, 0, 0))
+
+    def test_leader_advertises_top_three(self):
+        """Test the three brightest positions are the ones advertised"""
+        audio = FakeAudio()
+        # Intensities 75, 225, 150, 175, 25, 62 (|delta| * 2.5); the 150
+        # is pushed from second to third place by the later 175
+        audio.deltas = [[30, -90, 60, 70, 10, -25]]
+        self.dance.audio = audio
+        self.dance._audio_ok = True
+
+        self.dance._leader_frame()
+        expected = [(1, 225, 0), (3, 175, 1), (2, 150, 1)]
+        self.assert_equal(self.dance._last_triples, expected)
+        parsed = self.dance._parse_name(self.dance._build_adv_name_from_triples())
+        self.assert_equal(parsed["triples"], expected)
+
+    def test_follower_step_capped_then_converges(self):
+        """Test a step change moves toward the target, capped by _smooth_alpha"""
+        triples = [(0, 200, 0), (5, 120, 2), (0, 0, 0)]
+        target = self.dance._themed_rgb(200, 0) + self.dance._themed_rgb(120, 2)
+        alpha = self.dance._smooth_alpha
+
+        # A long gap would let the One-Euro alpha exceed the cap
+        self._render_at(1000, triples)
+        first = self._pixel(0) + self._pixel(5)
+        for got, want in zip(first, target):
+            self.assert_equal(got, int(want * alpha + 0.5))
+
+        previous = first
+        for step in range(1, 300):
+            self._render_at(1000 + 20 * step, triples)
+            current = self._pixel(0) + self._pixel(5)
+            for got, last, want in zip(current, previous, target):
+                self.assert_true(last <= got <= want, "Should move toward target")
+            previous = current
+        self.assert_equal(previous, target)
+        self.assert_equal(self._pixel(1), (0, 0, 0))
+
+    def test_follower_updates_smooth_state(self):
+        """Test the follower frame is rendered from the _smooth_* arrays"""
+        self._render_at(1000, [(3, 200, 1), (8, 90, 2), (0, 0, 0)])
+        dance = self.dance
+        for i in range(dance._NUM_PIXELS):
+            levels = (dance._smooth_r[i], dance._smooth_g[i], dance._smooth_b[i])
+            self.assert_equal(self._pixel(i), tuple(int(v + 0.5) for v in levels))
+        self.assert_true(dance._smooth_g[3] > 0, "Green pixel 3 should be lit")
+
+    def test_follower_skips_identical_show(self):
+        """Test a settled frame is shown once, and again after cleanup or a role switch"""
+        triples = [(4, 180, 0), (0, 0, 0), (0, 0, 0)]
+        for step in range(300):
+            self._render_at(1000 + 20 * step, triples)
+        shows = len(self.pixels.shown)
+        self._render_at(8000, triples)
+        self.assert_equal(len(self.pixels.shown), shows, "Identical frame re-shown")
+
+        self.dance.cleanup()
+        self._render_at(8020, triples)
+        self.assert_equal(len(self.pixels.shown), shows + 2, "Cleanup + next frame")
+        self.assert_equal(self.pixels.shown[-1], bytes(self.dance._frame))
+
+        self._render_at(8040, triples)
+        self.assert_equal(len(self.pixels.shown), shows + 2)
+        self.dance._select_run_impl(2)
+        self._render_at(8060, triples)
+        self.assert_equal(len(self.pixels.shown), shows + 3, "Role switch + next frame")
+
+    def test_follower_render_rate_limited(self):
+        """Test renders within _MIN_RENDER_NS of the last one are dropped"""
+        self._render_at(1000, [(2, 255, 0)] * 3)
+        frame = bytes(self.dance._frame)
+        shows = len(self.pixels.shown)
+
+        self._render_at(1000 + self.dance._MIN_RENDER_MS - 1, [(7, 255, 1)] * 3)
+        self.assert_equal(bytes(self.dance._frame), frame)
+        self.assert_equal(len(self.pixels.shown), shows)
+        self.assert_equal(self.dance._last_render_ns, 1000 * 1000000)
+
+        self._render_at(1000 + self.dance._MIN_RENDER_MS, [(7, 255, 1)] * 3)
+        self.assert_true(bytes(self.dance._frame) != frame, "Due frame should render")
+
+
+if __name__ == '__main__':
+    test = TestDancePartyProtocol()
+    test.run_all_tests()
+    test = TestDancePartyDispatch()
+    test.run_all_tests()
+    test = TestDancePartyRender()
+    test.run_all_tests()
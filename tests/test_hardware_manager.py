@@ -0,0 +1,86 @@
+"""
+Unit tests for HardwareManager
+Tests audio delta to pixel mapping
+"""
+import sys
+import os
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from tests.test_framework import TestCase
+from tests.mocks import setup_test_environment
+
+# Setup mocks if needed
+setup_test_environment()
+
+from hardware_manager import HardwareManager
+
+try:
+    from simpleio import map_range
+except ImportError:
+    def map_range(x, in_min, in_max, out_min, out_max):
+        """simpleio.map_range, for hosts without the library"""
+        mapped = (x - in_min) * (out_max - out_min) / (in_max - in_min) + out_min
+        if out_min <= out_max:
+            return max(min(mapped, out_max), out_min)
+        return min(max(mapped, out_max), out_min)
+
+
+def _map_deltas_reference(deltas):
+    """The original map_range-based mapping"""
+    pixel_data = [0] * 10
+    for ii, delta in enumerate(deltas):
+        ix = round(map_range(ii, 0, len(deltas), 0, 9))
+        pixel_data[ix] += delta
+    return pixel_data
+
+
+class TestHardwareManager(TestCase):
+    """Test cases for HardwareManager"""
+
+    def setUp(self):
+        """Setup test fixtures"""
+        self.hardware = HardwareManager()
+
+    def tearDown(self):
+        """Clean up after tests"""
+        self.hardware = None
+
+    def test_buckets_match_map_range(self):
+        """Test cached buckets put every delta where map_range did"""
+        for n in (1, 2, 3, 7, 9, 10, 11, 16, 20, 32, 64, 100):
+            deltas = [1 << (ii % 20) for ii in range(n)]
+            result = self.hardware.map_deltas_to_pixels(deltas)
+            self.assert_equal(list(result), _map_deltas_reference(deltas),
+                              "Mismatch for %d deltas" % n)
+
+    def test_bucket_table_cached_per_length(self):
+        """Test one bucket table is built per delta count"""
+        self.hardware.map_deltas_to_pixels([1] * 32)
+        table = self.hardware._bucket_cache[32]
+        self.hardware.map_deltas_to_pixels([2] * 32)
+        self.assert_true(self.hardware._bucket_cache[32] is table)
+        self.hardware.map_deltas_to_pixels([2] * 16)
+        self.assert_equal(sorted(self.hardware._bucket_cache), [16, 32])
+
+    def test_result_list_is_reused(self):
+        """Test the returned list is shared and rewritten by the next call"""
+        first = self.hardware.map_deltas_to_pixels([5] * 10)
+        kept = list(first)
+        second = self.hardware.map_deltas_to_pixels([1] * 20)
+        self.assert_true(first is second, "The same buffer is returned")
+        self.assert_equal(second, _map_deltas_reference([1] * 20),
+                          "Previous values are cleared, not accumulated")
+        self.assert_equal(kept, _map_deltas_reference([5] * 10),
+                          "A copy keeps the earlier result")
+
+    def test_empty_deltas(self):
+        """Test no deltas maps to an all-zero frame"""
+        self.hardware.map_deltas_to_pixels([9] * 10)
+        self.assert_equal(self.hardware.map_deltas_to_pixels([]), [0] * 10)
+
+
+if __name__ == '__main__':
+    test = TestHardwareManager()
+    test.run_all_tests()
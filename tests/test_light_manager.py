@@ -0,0 +1,105 @@
+"""
+Unit tests for LightManager
+Tests light history tracking and interaction detection
+"""
+import sys
+import os
+import random
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from tests.test_framework import TestCase
+from tests.mocks import setup_test_environment
+
+# Setup mocks if needed
+setup_test_environment()
+
+import light_manager
+from light_manager import LightManager
+
+
+class FakeTime:
+    """Stand-in time module that advances 0.2 s per reading"""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def monotonic(self):
+        self.now += 0.2
+        return self.now
+
+
+class TestLightManager(TestCase):
+    """Test cases for LightManager interaction detection"""
+
+    def setUp(self):
+        """Setup test fixtures"""
+        self._real_time = light_manager.time
+        light_manager.time = FakeTime()
+        self.cp = light_manager.cp
+        self._real_light = self.cp.light
+        self.manager = LightManager(enable_interactions=True)
+
+    def tearDown(self):
+        """Clean up after tests"""
+        light_manager.time = self._real_time
+        self.cp.light = self._real_light
+        self.manager = None
+
+    def _read(self, level):
+        self.cp.light = level
+        return self.manager.check_light_interaction()
+
+    def test_needs_three_readings(self):
+        """Test detection waits for three readings of history"""
+        self._read(10)
+        self.assert_false(self._read(200)[0], "Two readings of history is not enough")
+        detected, change, current = self._read(200)
+        self.assert_true(detected, "Large change should be detected")
+        self.assert_equal((change, current), (190, 200))
+
+    def test_dark_readings_do_not_count(self):
+        """Test a covered sensor (reading 0) doesn't build up history"""
+        for _ in range(5):
+            self.assert_false(self._read(0)[0])
+        self.assert_equal(self.manager.light_history_count, 0)
+        self.assert_false(self._read(200)[0], "One non-zero reading is not enough")
+        self.assert_false(self._read(200)[0])
+        self.assert_true(self._read(200)[0], "Third non-zero reading enables detection")
+
+    def test_count_matches_non_zero_history(self):
+        """Test the counter always equals the non-zero readings in the buffer"""
+        rng = random.Random(1234)
+        for _ in range(200):
+            self._read(rng.choice((0, 0, 5, 40, 120, 300)))
+            expected = len([x for x in self.manager.light_history if x > 0])
+            self.assert_equal(self.manager.light_history_count, expected)
+
+    def test_history_expires_when_covered(self):
+        """Test old readings age out once the sensor is covered"""
+        for _ in range(5):
+            self._read(50)
+        for _ in range(3):
+            self._read(0)
+        self.assert_equal(self.manager.light_history_count, 2)
+        self.assert_false(self._read(0)[0], "Covered sensor has too little history")
+
+    def test_reset_clears_history(self):
+        """Test reset_light_history starts counting again"""
+        for _ in range(3):
+            self._read(50)
+        self.manager.reset_light_history()
+        self.assert_equal(self.manager.light_history_count, 0)
+        self.assert_equal(self.manager.light_history, [0] * 5)
+
+    def test_interactions_disabled(self):
+        """Test a manager without interactions only reports the light level"""
+        manager = LightManager(enable_interactions=False)
+        self.cp.light = 77
+        self.assert_equal(manager.check_light_interaction(), (False, 0, 77))
+
+
+if __name__ == '__main__':
+    test = TestLightManager()
+    test.run_all_tests()
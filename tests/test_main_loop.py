@@ -0,0 +1,395 @@
+"""
+Unit tests for the main controller (code.py)
+Tests task scheduling, config auto-save pacing, button feedback
+animation and button setup
+"""
+import sys
+import os
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from tests.test_framework import TestCase
+from tests.mocks import setup_test_environment
+
+# Setup mocks if needed
+setup_test_environment()
+
+
+def _load_main_module():
+    """Import code.py under another name (``code`` clashes with the stdlib module)"""
+    if 'illo_main' in sys.modules:
+        return sys.modules['illo_main']
+    import importlib.util
+    path = os.path.join(os.path.dirname(__file__), '..', 'code.py')
+    spec = importlib.util.spec_from_file_location('illo_main', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    sys.modules['illo_main'] = module
+    return module
+
+
+illo_main = _load_main_module()
+
+
+class FakeClock:
+    """Stand-in for code._ticks_ms() that only moves when told to"""
+
+    def __init__(self, start_ms=0):
+        self.now_ms = start_ms
+
+    def __call__(self):
+        return self.now_ms
+
+
+class TestTaskScheduler(TestCase):
+    """Test cases for TaskScheduler"""
+
+    def setUp(self):
+        """Setup test fixtures"""
+        self.clock = FakeClock(1000)
+        self._real_ticks_ms = illo_main._ticks_ms
+        illo_main._ticks_ms = self.clock
+        self.scheduler = illo_main.TaskScheduler()
+        self.calls = []
+
+    def tearDown(self):
+        """Clean up after tests"""
+        illo_main._ticks_ms = self._real_ticks_ms
+        self.scheduler = None
+
+    def _task(self, name):
+        def callback():
+            self.calls.append(name)
+        return callback
+
+    def test_next_due_tracks_earliest_task(self):
+        """Test next_due_ms is the earliest deadline after adding tasks"""
+        self.assert_equal(self.scheduler.next_due_ms, None, "No tasks means nothing is due")
+        self.scheduler.add_task('slow', 2.0, self._task('slow'))
+        self.assert_equal(self.scheduler.next_due_ms, 3000)
+        self.scheduler.add_task('fast', 0.5, self._task('fast'))
+        self.assert_equal(self.scheduler.next_due_ms, 1500)
+
+    def test_due_tasks_run_in_slot_order(self):
+        """Test only due tasks run, in the order they were added"""
+        self.scheduler.add_task('a', 1.0, self._task('a'))
+        self.scheduler.add_task('b', 0.5, self._task('b'))
+        self.scheduler.add_task('c', 2.0, self._task('c'))
+
+        self.scheduler.run_due_tasks(1499)
+        self.assert_equal(self.calls, [], "Nothing is due before the first deadline")
+
+        self.scheduler.run_due_tasks(1500)
+        self.assert_equal(self.calls, ['b'])
+        self.assert_equal(self.scheduler.next_due_ms, 2000)
+
+        self.calls = []
+        self.scheduler.run_due_tasks(3000)
+        self.assert_equal(self.calls, ['a', 'b', 'c'], "Due tasks run in slot order")
+        self.assert_equal(self.scheduler.next_due_ms, 3500)
+
+    def test_disabled_task_is_not_due(self):
+        """Test disabled tasks neither run nor set next_due_ms"""
+        self.scheduler.add_task('off', 0.1, self._task('off'), enabled=False)
+        self.scheduler.add_task('on', 1.0, self._task('on'))
+        self.assert_equal(self.scheduler.next_due_ms, 2000)
+
+        self.scheduler.run_due_tasks(2000)
+        self.assert_equal(self.calls, ['on'])
+
+        self.scheduler.enable_task('off')
+        self.assert_equal(self.scheduler.next_due_ms, 1100)
+
+    def test_set_interval_at_moves_next_due_earlier(self):
+        """Test shortening an interval pulls next_due_ms in"""
+        slot = self.scheduler.add_task('cleanup', 30.0, self._task('cleanup'))
+        self.assert_equal(self.scheduler.next_due_ms, 31000)
+
+        self.scheduler.set_interval_at(slot, 20.0)
+        self.assert_equal(self.scheduler.next_due_ms, 21000)
+
+        self.scheduler.run_due_tasks(21000)
+        self.assert_equal(self.calls, ['cleanup'])
+
+    def test_set_interval_at_moves_next_due_later(self):
+        """Test lengthening an interval pushes next_due_ms out"""
+        slot = self.scheduler.add_task('cleanup', 20.0, self._task('cleanup'))
+        self.scheduler.add_task('status', 60.0, self._task('status'))
+        self.assert_equal(self.scheduler.next_due_ms, 21000)
+
+        self.scheduler.set_interval_at(slot, 30.0)
+        self.assert_equal(self.scheduler.next_due_ms, 31000)
+
+        self.scheduler.run_due_tasks(21000)
+        self.assert_equal(self.calls, [], "Old deadline no longer runs the task")
+
+    def test_failing_task_does_not_starve_others(self):
+        """Test an exception in one task still lets later tasks run"""
+        def broken():
+            raise RuntimeError("boom")
+
+        self.scheduler.add_task('broken', 1.0, broken)
+        self.scheduler.add_task('ok', 1.0, self._task('ok'))
+
+        self.scheduler.run_due_tasks(2000)
+        self.assert_equal(self.calls, ['ok'])
+        # The failed task was not marked as run, so it stays due for a retry
+        self.assert_equal(self.scheduler.next_due_ms, 2000)
+
+
+class TestConfigSavePacing(TestCase):
+    """Test cases for the config auto-save quiet time and minimum gap"""
+
+    def test_waits_for_quiet_time(self):
+        """Test a change is not written until it has been quiet long enough"""
+        delay = illo_main._CONFIG_SAVE_DELAY_MS
+        self.assert_false(illo_main._config_save_due(10000 + delay - 1, 10000, None))
+        self.assert_true(illo_main._config_save_due(10000 + delay, 10000, None))
+
+    def test_new_change_restarts_quiet_time(self):
+        """Test a later change pushes the write back"""
+        delay = illo_main._CONFIG_SAVE_DELAY_MS
+        self.assert_false(illo_main._config_save_due(10000 + delay, 12000, None),
+                          "Quiet time counts from the latest change")
+
+    def test_minimum_gap_between_writes(self):
+        """Test writes stay at least the minimum gap apart"""
+        gap = illo_main._CONFIG_MIN_SAVE_GAP_MS
+        last_save = 50000
+        dirty_since = last_save + 1000
+        self.assert_false(illo_main._config_save_due(last_save + gap - 1, dirty_since, last_save))
+        self.assert_true(illo_main._config_save_due(last_save + gap, dirty_since, last_save))
+
+
+def _faded(frame, steps):
+    """Expected frame after ``steps`` x0.8 fixed-point fade steps"""
+    frame = bytearray(frame)
+    for _ in range(steps):
+        for j in range(len(frame)):
+            frame[j] = (frame[j] * 205) >> 8
+    return bytes(frame)
+
+
+class TestFeedbackAnimator(TestCase):
+    """Test cases for the non-blocking button feedback animation"""
+
+    def setUp(self):
+        """Setup test fixtures"""
+        self.clock = FakeClock(1000)
+        self._real_ticks_ms = illo_main._ticks_ms
+        illo_main._ticks_ms = self.clock
+        self.pixels = illo_main.cp.pixels
+        self.pixels.shown = []
+        self.animator = illo_main.FeedbackAnimator()
+        self.frame = illo_main._PATTERN_FRAMES[1]
+
+    def tearDown(self):
+        """Clean up after tests"""
+        illo_main._ticks_ms = self._real_ticks_ms
+        self.animator = None
+
+    def test_idle_animator_is_inactive(self):
+        """Test a fresh animator never owns the ring"""
+        self.assert_false(self.animator.update(1000))
+        self.assert_equal(self.pixels.shown, [])
+
+    def test_hold_then_clear(self):
+        """Test a plain hold keeps the ring, clears it, then stays dark"""
+        self.animator.start(800, dark_ms=200)
+        self.assert_true(self.animator.update(1799), "Holding until the deadline")
+        self.assert_equal(self.pixels.shown, [], "Nothing drawn while holding")
+
+        self.assert_true(self.animator.update(1800), "Dark period still owns the ring")
+        self.assert_equal(self.pixels.shown, [bytes(30)], "Ring cleared after the hold")
+
+        self.assert_true(self.animator.update(1999))
+        self.assert_false(self.animator.update(2000), "Ring handed back to the routine")
+        self.assert_false(self.animator.update(5000))
+        self.assert_equal(len(self.pixels.shown), 1, "No further drawing once idle")
+
+    def test_fade_sequence(self):
+        """Test the fade steps x0.8 every 100 ms and ends with a clear"""
+        self.animator.start(1200, fade_frame=self.frame)
+        now = 2200
+        steps = 0
+        while self.animator.update(now):
+            now += illo_main.FeedbackAnimator._FADE_STEP_MS
+            steps += 1
+            self.assert_true(steps < 50, "Fade should finish")
+
+        expected = []
+        for step in range(1, illo_main.FeedbackAnimator._FADE_STEPS + 1):
+            faded = _faded(self.frame, step)
+            if not any(faded):
+                break
+            expected.append(faded)
+        expected.append(bytes(30))
+        self.assert_equal(self.pixels.shown, expected)
+
+    def test_fade_does_not_touch_source_frame(self):
+        """Test fading works on a scratch copy, not the shared pattern frame"""
+        before = bytes(self.frame)
+        self.animator.start(0, fade_frame=self.frame)
+        for step in range(5):
+            self.animator.update(1000 + step * 100)
+        self.assert_equal(bytes(self.frame), before)
+
+    def test_restart_while_running(self):
+        """Test start() mid-fade restarts from the new frame and hold"""
+        self.animator.start(0, fade_frame=self.frame)
+        self.animator.update(1000)
+        self.animator.update(1100)
+        self.pixels.shown = []
+
+        other = illo_main._PATTERN_FRAMES[3]
+        self.clock.now_ms = 1150
+        self.animator.start(500, fade_frame=other, dark_ms=100)
+        self.assert_true(self.animator.update(1649), "New hold restarts the deadline")
+        self.assert_equal(self.pixels.shown, [])
+
+        self.assert_true(self.animator.update(1650))
+        self.assert_equal(self.pixels.shown, [_faded(other, 1)],
+                          "Fade restarts from the new frame")
+
+
+class TestButtonFeedbackFrames(TestCase):
+    """Test cases for routine/mode/pattern feedback frames"""
+
+    def setUp(self):
+        """Setup test fixtures"""
+        self.pixels = illo_main.cp.pixels
+        self.pixels.shown = []
+
+    def tearDown(self):
+        """Clean up after tests"""
+        illo_main._feedback = illo_main.FeedbackAnimator()
+
+    def _lit(self):
+        frame = self.pixels.shown[-1]
+        return [i for i in range(10) if any(frame[3 * i:3 * i + 3])]
+
+    def _colors(self):
+        frame = self.pixels.shown[-1]
+        return set(tuple(frame[3 * i:3 * i + 3]) for i in self._lit())
+
+    def test_known_routine_and_mode(self):
+        """Test in-range numbers use their own colors"""
+        illo_main.show_routine_feedback(3)
+        self.assert_equal(self._lit(), [0, 1, 2])
+        self.assert_equal(self._colors(), {illo_main._ROUTINE_COLORS[2]})
+        illo_main.show_mode_feedback(2)
+        self.assert_equal(self._lit(), [0, 3])
+        self.assert_equal(self._colors(), {illo_main._MODE_COLORS[1]})
+
+    def test_unknown_routine_shows_white(self):
+        """Test an out-of-range routine shows the white Unknown indicator"""
+        illo_main.show_routine_feedback(5)
+        self.assert_equal(self._lit(), [0, 1, 2, 3, 4])
+        self.assert_equal(self._colors(), {(255, 255, 255)})
+        illo_main.show_routine_feedback(12)
+        self.assert_equal(self._lit(), list(range(10)), "Clamped to the ring")
+        illo_main.show_routine_feedback(0)
+        self.assert_equal(self._lit(), [])
+
+    def test_unknown_mode_shows_white(self):
+        """Test an out-of-range mode shows white quadrant pixels"""
+        illo_main.show_mode_feedback(6)
+        self.assert_equal(self._lit(), [0, 3, 6, 9])
+        self.assert_equal(self._colors(), {(255, 255, 255)})
+        illo_main.show_mode_feedback(-1)
+        self.assert_equal(self._lit(), [])
+
+    def test_unknown_pattern_shows_white(self):
+        """Test an out-of-range breathing pattern shows white rings"""
+        illo_main.show_breathing_pattern_feedback(7)
+        self.assert_equal(self._lit(), [2, 3, 4, 5, 6, 7])
+        self.assert_true((255, 255, 255) in self._colors())
+        illo_main.show_breathing_pattern_feedback(0)
+        self.assert_equal(self._lit(), [4, 5])
+
+
+class FakeKeypad:
+    """Stand-in keypad module whose Keys can be told to fail"""
+
+    fail_with = None
+
+    class Keys:
+        def __init__(self, pins, value_when_pressed, pull):
+            if FakeKeypad.fail_with is not None:
+                raise FakeKeypad.fail_with
+            self.pins = pins
+
+
+class TestButtonKeys(TestCase):
+    """Test cases for keypad button setup and its polling fallback"""
+
+    def setUp(self):
+        """Setup test fixtures"""
+        self.cp = illo_main.cp
+        self._saved = {
+            name: getattr(illo_main, name, None)
+            for name in ('_HAS_KEYPAD', 'keypad', 'board', 'digitalio')
+        }
+        self._saved_buttons = (self.cp._a, self.cp._b)
+        # Fresh claimed button inputs, since tests release them
+        digitalio = sys.modules['digitalio']
+        board = sys.modules['board']
+        self.cp._a = digitalio.DigitalInOut(board.BUTTON_A)
+        self.cp._a.switch_to_input(pull=digitalio.Pull.DOWN)
+        self.cp._b = digitalio.DigitalInOut(board.BUTTON_B)
+        self.cp._b.switch_to_input(pull=digitalio.Pull.DOWN)
+        illo_main._HAS_KEYPAD = True
+        illo_main.keypad = FakeKeypad
+        illo_main.board = sys.modules['board']
+        illo_main.digitalio = sys.modules['digitalio']
+        FakeKeypad.fail_with = None
+
+    def tearDown(self):
+        """Clean up after tests"""
+        for name, value in self._saved.items():
+            setattr(illo_main, name, value)
+        self.cp._a, self.cp._b = self._saved_buttons
+        FakeKeypad.fail_with = None
+
+    def test_keypad_takes_over_buttons(self):
+        """Test cp's button pins are released for keypad"""
+        old_a, old_b = self.cp._a, self.cp._b
+        keys = illo_main._create_button_keys()
+        self.assert_not_none(keys, "Keys should be created")
+        self.assert_true(old_a.deinited and old_b.deinited, "cp's pins should be released")
+
+    def test_keypad_failure_keeps_polling_working(self):
+        """Test a failing Keys leaves cp.button_a/button_b readable"""
+        FakeKeypad.fail_with = ValueError("BUTTON_A in use")
+        keys = illo_main._create_button_keys()
+        self.assert_equal(keys, None, "Should fall back to polling")
+
+        # The polling path in main() reads these every loop
+        self.assert_false(self.cp.button_a)
+        self.assert_false(self.cp.button_b)
+        self.cp._a.value = True  # Simulate pressing Button A
+        self.assert_true(self.cp.button_a, "Button A should read as pressed")
+        self.assert_equal(self.cp._b.pull, sys.modules['digitalio'].Pull.DOWN,
+                          "Restored buttons should be pulled down like cp's")
+
+    def test_no_keypad_leaves_buttons_alone(self):
+        """Test nothing is released when keypad is unavailable"""
+        illo_main._HAS_KEYPAD = False
+        old_a = self.cp._a
+        self.assert_equal(illo_main._create_button_keys(), None)
+        self.assert_false(old_a.deinited, "cp's pins should stay claimed")
+        self.assert_true(self.cp._a is old_a)
+
+
+if __name__ == '__main__':
+    test = TestTaskScheduler()
+    test.run_all_tests()
+    test = TestConfigSavePacing()
+    test.run_all_tests()
+    test = TestFeedbackAnimator()
+    test.run_all_tests()
+    test = TestButtonFeedbackFrames()
+    test.run_all_tests()
+    test = TestButtonKeys()
+    test.run_all_tests()
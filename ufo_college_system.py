@@ -115,14 +115,7 @@ class UFOCollegeSystem:
 
         try:
             # Get BPM for synchronization
-            bpm = 120
-            if self.college_manager.college_data:
-                if 'chants' in self.college_manager.college_data:
-                    if 'primary' in self.college_manager.college_data['chants']:
-                        chant_primary = self.college_manager.college_data['chants'][
-                            'primary']
-                        if 'bpm' in chant_primary:
-                            bpm = chant_primary['bpm']
+            bpm = self.college_manager.get_chant_bpm()
 
             # Play music with synchronized light callback
             return self.music_player.play_music_with_lights(
@@ -328,15 +321,7 @@ class UFOCollegeSystem:
 
         try:
             # Get BPM from college data (default to 120 BPM if not specified)
-            bpm = 120  # Default fallback
-
-            if self.college_manager.college_data:
-                if 'chants' in self.college_manager.college_data:
-                    if 'primary' in self.college_manager.college_data['chants']:
-                        chant_primary = self.college_manager.college_data['chants'][
-                            'primary']
-                        if 'bpm' in chant_primary:
-                            bpm = chant_primary['bpm']
+            bpm = self.college_manager.get_chant_bpm()
 
             # Chants repeat 3 times
             return self.music_player.play_music(hardware, sound_enabled, chant_notes,
@@ -357,9 +342,7 @@ class UFOCollegeSystem:
 
         try:
             # Get BPM from college data (default to 120 BPM if not specified)
-            bpm = 120
-            if self.college_manager.college_data and 'fight_song' in self.college_manager.college_data:
-                bpm = self.college_manager.college_data['fight_song'].get('bpm', 120)
+            bpm = self.college_manager.get_fight_song_bpm()
 
             # Fight songs play once
             return self.music_player.play_music(hardware, sound_enabled,
@@ -3,6 +3,7 @@
 
 import time
 import math
+import gc
 import random
 from base_routine import BaseRoutine
 from audio_processor import AudioProcessor
@@ -32,7 +33,7 @@ class UFOIntelligence(BaseRoutine):
         self._college_spirit_enabled = college_spirit_enabled
         self._college = college
 
-        # Load configuration using ConfigManager consistently
+        # Load configuration using config_manager consistently
         self.chant_detection_enabled = self._load_chant_detection_setting()
 
         # Audio-reactive light pattern state
@@ -66,11 +67,10 @@ class UFOIntelligence(BaseRoutine):
 
     @staticmethod
     def _load_chant_detection_setting():
-        """Load chant detection setting using ConfigManager consistently."""
+        """Load chant detection setting using config_manager consistently."""
         try:
-            from config_manager import ConfigManager
-            config_mgr = ConfigManager()
-            config = config_mgr.load_config()
+            from config_manager import load_config
+            config = load_config()
             return config.get('college_chant_detection_enabled', False)
         except Exception as e:
             print("[UFO AI] Config load error: %s" % str(e))
@@ -489,7 +489,6 @@ class UFOIntelligence(BaseRoutine):
         self.light_pattern_state = {}
 
         # Force garbage collection
-        import gc
         gc.collect()
 
     # Expose key properties for compatibility with existing code